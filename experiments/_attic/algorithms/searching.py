@@ -4,371 +4,373 @@ Comprehensive Searching Algorithms Implementation
 This module contains various searching algorithms and related utilities.
 """
 
+import warnings
+from bisect import bisect_left, bisect_right
 from typing import List, Optional, Tuple
 import math
 
 
-class SearchingAlgorithms:
-    """Collection of searching algorithms."""
+def linear_search(arr: List[int], target: int) -> int:
+    """
+    Linear Search - O(n) time, O(1) space
+
+    Sequentially checks each element until target is found
+    (list.index runs the scan in C).
+
+    Returns:
+        Index of target if found, -1 otherwise
+    """
+    try:
+        return arr.index(target)
+    except ValueError:
+        return -1
+
+
+def binary_search(arr: List[int], target: int) -> int:
+    """
+    Binary Search - O(log n) time, O(1) space
+
+    Searches sorted array by repeatedly dividing search interval in half
+    (bisect_left does the halving in C). Array must be sorted.
+
+    Returns:
+        Index of target if found, -1 otherwise
+    """
+    i = bisect_left(arr, target)
+    return i if i < len(arr) and arr[i] == target else -1
+
 
-    @staticmethod
-    def linear_search(arr: List[int], target: int) -> int:
-        """
-        Linear Search - O(n) time, O(1) space
+def binary_search_branchless(arr: List[int], target: int) -> int:
+    """
+    Binary Search (Branchless) - O(log n) time, O(1) space
 
-        Sequentially checks each element until target is found.
+    Fixed-shape loop that always halves the remaining length and moves
+    the base by half * (comparison result), so there is no
+    data-dependent branch per step; compiled code turns this into a
+    conditional move. Array must be sorted.
 
-        Returns:
-            Index of target if found, -1 otherwise
-        """
-        for i, val in enumerate(arr):
-            if val == target:
-                return i
+    Returns:
+        Index of target if found, -1 otherwise
+    """
+    length = len(arr)
+    if length == 0:
         return -1
 
-    @staticmethod
-    def binary_search(arr: List[int], target: int) -> int:
-        """
-        Binary Search - O(log n) time, O(1) space
+    # Invariant: the first index with arr[i] >= target is in
+    # [pos, pos + length]
+    pos = 0
+    while length > 1:
+        half = length // 2
+        pos += half * (arr[pos + half - 1] < target)
+        length -= half
 
-        Searches sorted array by repeatedly dividing search interval in half.
-        Array must be sorted.
+    pos += arr[pos] < target
+    return pos if pos < len(arr) and arr[pos] == target else -1
 
-        Returns:
-            Index of target if found, -1 otherwise
-        """
-        left, right = 0, len(arr) - 1
 
-        while left <= right:
-            mid = left + (right - left) // 2
+def binary_search_recursive(arr: List[int], target: int,
+                            left: int = 0, right: int = None) -> int:
+    """
+    Binary Search (Recursive) - deprecated
 
-            if arr[mid] == target:
-                return mid
-            elif arr[mid] < target:
-                left = mid + 1
-            else:
-                right = mid - 1
+    Kept for API compatibility: searches arr[left:right + 1] with the
+    iterative bisect-based search instead of one stack frame per halving.
+    """
+    warnings.warn("binary_search_recursive is deprecated, use binary_search",
+                  DeprecationWarning, stacklevel=2)
+    if right is None:
+        right = len(arr) - 1
+
+    if left > right:
+        return -1
+
+    i = bisect_left(arr, target, left, right + 1)
+    return i if i <= right and arr[i] == target else -1
+
+
+def jump_search(arr: List[int], target: int) -> int:
+    """
+    Jump Search - O(√n) time, O(1) space
+
+    Works on sorted arrays. Jumps ahead by fixed steps,
+    then performs linear search in identified block.
 
+    Returns:
+        Index of target if found, -1 otherwise
+    """
+    n = len(arr)
+    if n == 0:
         return -1
 
-    @staticmethod
-    def binary_search_recursive(arr: List[int], target: int,
-                                left: int = 0, right: int = None) -> int:
-        """
-        Binary Search (Recursive) - O(log n) time, O(log n) space
+    block = math.isqrt(n)  # Jump size is fixed, compute it once
+    step = block
+    prev = 0
 
-        Recursive implementation of binary search.
-        """
-        if right is None:
-            right = len(arr) - 1
+    # Find block where target may exist
+    while arr[(step if step < n else n) - 1] < target:
+        if step >= n:
+            return -1  # Target is beyond the last element
+        prev = step
+        step += block
 
-        if left > right:
+    # Search the identified block
+    i = bisect_left(arr, target, prev, step if step < n else n)
+    if i < n and arr[i] == target:
+        return i
+
+    return -1
+
+
+def interpolation_search(arr: List[int], target: int) -> int:
+    """
+    Interpolation Search - O(log log n) average, O(n) worst
+
+    Works on sorted, uniformly distributed arrays.
+    Estimates position based on value.
+
+    Returns:
+        Index of target if found, -1 otherwise
+    """
+    left, right = 0, len(arr) - 1
+
+    while left <= right and target >= arr[left] and target <= arr[right]:
+        if left == right:
+            if arr[left] == target:
+                return left
             return -1
 
-        mid = left + (right - left) // 2
+        # Estimate position
+        pos = left + int(((target - arr[left]) / (arr[right] - arr[left])) *
+                       (right - left))
 
-        if arr[mid] == target:
-            return mid
-        elif arr[mid] < target:
-            return SearchingAlgorithms.binary_search_recursive(arr, target, mid + 1, right)
+        if arr[pos] == target:
+            return pos
+        elif arr[pos] < target:
+            left = pos + 1
         else:
-            return SearchingAlgorithms.binary_search_recursive(arr, target, left, mid - 1)
-
-    @staticmethod
-    def jump_search(arr: List[int], target: int) -> int:
-        """
-        Jump Search - O(√n) time, O(1) space
-
-        Works on sorted arrays. Jumps ahead by fixed steps,
-        then performs linear search in identified block.
-
-        Returns:
-            Index of target if found, -1 otherwise
-        """
-        n = len(arr)
-        step = int(math.sqrt(n))
-        prev = 0
-
-        # Find block where target may exist
-        while arr[min(step, n) - 1] < target:
-            prev = step
-            step += int(math.sqrt(n))
-            if prev >= n:
-                return -1
-
-        # Linear search in identified block
-        while arr[prev] < target:
-            prev += 1
-            if prev == min(step, n):
-                return -1
-
-        if arr[prev] == target:
-            return prev
+            right = pos - 1
 
-        return -1
+    return -1
 
-    @staticmethod
-    def interpolation_search(arr: List[int], target: int) -> int:
-        """
-        Interpolation Search - O(log log n) average, O(n) worst
-
-        Works on sorted, uniformly distributed arrays.
-        Estimates position based on value.
-
-        Returns:
-            Index of target if found, -1 otherwise
-        """
-        left, right = 0, len(arr) - 1
-
-        while left <= right and target >= arr[left] and target <= arr[right]:
-            if left == right:
-                if arr[left] == target:
-                    return left
-                return -1
-
-            # Estimate position
-            pos = left + int(((target - arr[left]) / (arr[right] - arr[left])) *
-                           (right - left))
-
-            if arr[pos] == target:
-                return pos
-            elif arr[pos] < target:
-                left = pos + 1
-            else:
-                right = pos - 1
 
-        return -1
+def exponential_search(arr: List[int], target: int) -> int:
+    """
+    Exponential Search - O(log n) time
 
-    @staticmethod
-    def exponential_search(arr: List[int], target: int) -> int:
-        """
-        Exponential Search - O(log n) time
+    Finds range where target exists, then performs binary search.
+    Useful for unbounded/infinite arrays.
 
-        Finds range where target exists, then performs binary search.
-        Useful for unbounded/infinite arrays.
+    Returns:
+        Index of target if found, -1 otherwise
+    """
+    if arr[0] == target:
+        return 0
 
-        Returns:
-            Index of target if found, -1 otherwise
-        """
-        if arr[0] == target:
-            return 0
+    # Find range for binary search
+    i = 1
+    while i < len(arr) and arr[i] <= target:
+        i *= 2
 
-        # Find range for binary search
-        i = 1
-        while i < len(arr) and arr[i] <= target:
-            i *= 2
+    # Binary search in found range
+    left = i // 2
+    right = min(i, len(arr) - 1)
 
-        # Binary search in found range
-        left = i // 2
-        right = min(i, len(arr) - 1)
+    while left <= right:
+        mid = left + (right - left) // 2
+
+        if arr[mid] == target:
+            return mid
+        elif arr[mid] < target:
+            left = mid + 1
+        else:
+            right = mid - 1
 
-        while left <= right:
-            mid = left + (right - left) // 2
+    return -1
 
-            if arr[mid] == target:
-                return mid
-            elif arr[mid] < target:
-                left = mid + 1
-            else:
-                right = mid - 1
 
-        return -1
+def ternary_search(arr: List[int], target: int) -> int:
+    """
+    Ternary Search - O(log₃ n) time
 
-    @staticmethod
-    def ternary_search(arr: List[int], target: int) -> int:
-        """
-        Ternary Search - O(log₃ n) time
-
-        Divides array into three parts and determines which part
-        contains target.
-
-        Returns:
-            Index of target if found, -1 otherwise
-        """
-        left, right = 0, len(arr) - 1
-
-        while left <= right:
-            # Divide into three parts
-            mid1 = left + (right - left) // 3
-            mid2 = right - (right - left) // 3
-
-            if arr[mid1] == target:
-                return mid1
-            if arr[mid2] == target:
-                return mid2
-
-            if target < arr[mid1]:
-                right = mid1 - 1
-            elif target > arr[mid2]:
-                left = mid2 + 1
-            else:
-                left = mid1 + 1
-                right = mid2 - 1
+    Divides array into three parts and determines which part
+    contains target.
 
-        return -1
+    Returns:
+        Index of target if found, -1 otherwise
+    """
+    left, right = 0, len(arr) - 1
 
-    @staticmethod
-    def fibonacci_search(arr: List[int], target: int) -> int:
-        """
-        Fibonacci Search - O(log n) time, O(1) space
-
-        Uses Fibonacci numbers to divide array.
-        Similar to binary search but with different division strategy.
-
-        Returns:
-            Index of target if found, -1 otherwise
-        """
-        n = len(arr)
-
-        # Initialize Fibonacci numbers
-        fib_m2 = 0  # (m-2)'th Fibonacci number
-        fib_m1 = 1  # (m-1)'th Fibonacci number
-        fib_m = fib_m2 + fib_m1  # m'th Fibonacci number
-
-        # Find smallest Fibonacci number >= n
-        while fib_m < n:
-            fib_m2 = fib_m1
-            fib_m1 = fib_m
-            fib_m = fib_m2 + fib_m1
-
-        offset = -1
-
-        while fib_m > 1:
-            # Check if fib_m2 is valid index
-            i = min(offset + fib_m2, n - 1)
-
-            if arr[i] < target:
-                fib_m = fib_m1
-                fib_m1 = fib_m2
-                fib_m2 = fib_m - fib_m1
-                offset = i
-            elif arr[i] > target:
-                fib_m = fib_m2
-                fib_m1 = fib_m1 - fib_m2
-                fib_m2 = fib_m - fib_m1
-            else:
-                return i
+    while left <= right:
+        # Divide into three parts
+        mid1 = left + (right - left) // 3
+        mid2 = right - (right - left) // 3
 
-        # Check last element
-        if fib_m1 and offset + 1 < n and arr[offset + 1] == target:
-            return offset + 1
+        if arr[mid1] == target:
+            return mid1
+        if arr[mid2] == target:
+            return mid2
 
-        return -1
+        if target < arr[mid1]:
+            right = mid1 - 1
+        elif target > arr[mid2]:
+            left = mid2 + 1
+        else:
+            left = mid1 + 1
+            right = mid2 - 1
+
+    return -1
+
+
+def fibonacci_search(arr: List[int], target: int) -> int:
+    """
+    Fibonacci Search - O(log n) time, O(1) space
+
+    Uses Fibonacci numbers to divide array.
+    Similar to binary search but with different division strategy.
+
+    Returns:
+        Index of target if found, -1 otherwise
+    """
+    n = len(arr)
+
+    # Initialize Fibonacci numbers
+    fib_m2 = 0  # (m-2)'th Fibonacci number
+    fib_m1 = 1  # (m-1)'th Fibonacci number
+    fib_m = fib_m2 + fib_m1  # m'th Fibonacci number
+
+    # Find smallest Fibonacci number >= n
+    while fib_m < n:
+        fib_m2 = fib_m1
+        fib_m1 = fib_m
+        fib_m = fib_m2 + fib_m1
+
+    offset = -1
+
+    while fib_m > 1:
+        # Check if fib_m2 is valid index
+        i = min(offset + fib_m2, n - 1)
+
+        if arr[i] < target:
+            fib_m = fib_m1
+            fib_m1 = fib_m2
+            fib_m2 = fib_m - fib_m1
+            offset = i
+        elif arr[i] > target:
+            fib_m = fib_m2
+            fib_m1 = fib_m1 - fib_m2
+            fib_m2 = fib_m - fib_m1
+        else:
+            return i
 
-    @staticmethod
-    def find_first_occurrence(arr: List[int], target: int) -> int:
-        """
-        Find first occurrence of target in sorted array with duplicates.
+    # Check last element
+    if fib_m1 and offset + 1 < n and arr[offset + 1] == target:
+        return offset + 1
 
-        Returns:
-            Index of first occurrence, -1 if not found
-        """
-        left, right = 0, len(arr) - 1
-        result = -1
+    return -1
 
-        while left <= right:
-            mid = left + (right - left) // 2
 
-            if arr[mid] == target:
-                result = mid
-                right = mid - 1  # Continue searching left
-            elif arr[mid] < target:
-                left = mid + 1
-            else:
-                right = mid - 1
+def find_first_occurrence(arr: List[int], target: int) -> int:
+    """
+    Find first occurrence of target in sorted array with duplicates.
 
-        return result
+    Returns:
+        Index of first occurrence, -1 if not found
+    """
+    i = bisect_left(arr, target)
+    return i if i < len(arr) and arr[i] == target else -1
 
-    @staticmethod
-    def find_last_occurrence(arr: List[int], target: int) -> int:
-        """
-        Find last occurrence of target in sorted array with duplicates.
 
-        Returns:
-            Index of last occurrence, -1 if not found
-        """
-        left, right = 0, len(arr) - 1
-        result = -1
+def find_last_occurrence(arr: List[int], target: int) -> int:
+    """
+    Find last occurrence of target in sorted array with duplicates.
 
-        while left <= right:
-            mid = left + (right - left) // 2
+    Returns:
+        Index of last occurrence, -1 if not found
+    """
+    i = bisect_right(arr, target) - 1
+    return i if i >= 0 and arr[i] == target else -1
 
-            if arr[mid] == target:
-                result = mid
-                left = mid + 1  # Continue searching right
-            elif arr[mid] < target:
-                left = mid + 1
-            else:
-                right = mid - 1
 
-        return result
+def count_occurrences(arr: List[int], target: int) -> int:
+    """
+    Count occurrences of target in sorted array.
 
-    @staticmethod
-    def count_occurrences(arr: List[int], target: int) -> int:
-        """
-        Count occurrences of target in sorted array.
+    Returns:
+        Number of occurrences
+    """
+    first = bisect_left(arr, target)
+    return bisect_right(arr, target, first) - first
 
-        Returns:
-            Number of occurrences
-        """
-        first = SearchingAlgorithms.find_first_occurrence(arr, target)
-        if first == -1:
-            return 0
 
-        last = SearchingAlgorithms.find_last_occurrence(arr, target)
-        return last - first + 1
+def find_peak_element(arr: List[int]) -> int:
+    """
+    Find a peak element (greater than its neighbors).
 
-    @staticmethod
-    def find_peak_element(arr: List[int]) -> int:
-        """
-        Find a peak element (greater than its neighbors).
+    Returns:
+        Index of a peak element
+    """
+    left, right = 0, len(arr) - 1
 
-        Returns:
-            Index of a peak element
-        """
-        left, right = 0, len(arr) - 1
+    while left < right:
+        mid = left + (right - left) // 2
 
-        while left < right:
-            mid = left + (right - left) // 2
+        if arr[mid] > arr[mid + 1]:
+            right = mid
+        else:
+            left = mid + 1
 
-            if arr[mid] > arr[mid + 1]:
-                right = mid
-            else:
-                left = mid + 1
+    return left
 
-        return left
 
-    @staticmethod
-    def search_rotated_array(arr: List[int], target: int) -> int:
-        """
-        Search in a rotated sorted array.
+def search_rotated_array(arr: List[int], target: int) -> int:
+    """
+    Search in a rotated sorted array.
 
-        Returns:
-            Index of target if found, -1 otherwise
-        """
-        left, right = 0, len(arr) - 1
+    Returns:
+        Index of target if found, -1 otherwise
+    """
+    left, right = 0, len(arr) - 1
 
-        while left <= right:
-            mid = left + (right - left) // 2
+    while left <= right:
+        mid = left + (right - left) // 2
 
-            if arr[mid] == target:
-                return mid
+        if arr[mid] == target:
+            return mid
 
-            # Determine which half is sorted
-            if arr[left] <= arr[mid]:
-                # Left half is sorted
-                if arr[left] <= target < arr[mid]:
-                    right = mid - 1
-                else:
-                    left = mid + 1
+        # Determine which half is sorted
+        if arr[left] <= arr[mid]:
+            # Left half is sorted
+            if arr[left] <= target < arr[mid]:
+                right = mid - 1
             else:
-                # Right half is sorted
-                if arr[mid] < target <= arr[right]:
-                    left = mid + 1
-                else:
-                    right = mid - 1
+                left = mid + 1
+        else:
+            # Right half is sorted
+            if arr[mid] < target <= arr[right]:
+                left = mid + 1
+            else:
+                right = mid - 1
 
-        return -1
+    return -1
+
+
+class SearchingAlgorithms:
+    """Collection of searching algorithms (forwards to the module functions)."""
+
+    linear_search = staticmethod(linear_search)
+    binary_search = staticmethod(binary_search)
+    binary_search_branchless = staticmethod(binary_search_branchless)
+    binary_search_recursive = staticmethod(binary_search_recursive)
+    jump_search = staticmethod(jump_search)
+    interpolation_search = staticmethod(interpolation_search)
+    exponential_search = staticmethod(exponential_search)
+    ternary_search = staticmethod(ternary_search)
+    fibonacci_search = staticmethod(fibonacci_search)
+    find_first_occurrence = staticmethod(find_first_occurrence)
+    find_last_occurrence = staticmethod(find_last_occurrence)
+    count_occurrences = staticmethod(count_occurrences)
+    find_peak_element = staticmethod(find_peak_element)
+    search_rotated_array = staticmethod(search_rotated_array)
 
 
 def demo():
@@ -384,7 +386,7 @@ def demo():
     algorithms = [
         ("Linear Search", SearchingAlgorithms.linear_search),
         ("Binary Search", SearchingAlgorithms.binary_search),
-        ("Binary Search (Recursive)", SearchingAlgorithms.binary_search_recursive),
+        ("Binary Search (Branchless)", SearchingAlgorithms.binary_search_branchless),
         ("Jump Search", SearchingAlgorithms.jump_search),
         ("Interpolation Search", SearchingAlgorithms.interpolation_search),
         ("Exponential Search", SearchingAlgorithms.exponential_search),
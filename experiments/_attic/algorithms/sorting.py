@@ -6,34 +6,51 @@ with time and space complexity analysis.
 """
 
 from typing import List, Callable
+from bisect import bisect_left, bisect_right
+import heapq
+import os
 import time
-from functools import wraps
+from multiprocessing import Pool
+from collections import Counter
+from itertools import chain, repeat
+from functools import partial, wraps
 
 
 def time_it(func: Callable) -> Callable:
     """Decorator to measure execution time."""
     @wraps(func)
     def wrapper(*args, **kwargs):
-        start = time.time()
+        start = time.perf_counter_ns()
         result = func(*args, **kwargs)
-        end = time.time()
-        print(f"{func.__name__} took {(end - start) * 1000:.4f}ms")
+        end = time.perf_counter_ns()
+        print(f"{func.__name__} took {(end - start) / 1e6:.4f}ms")
         return result
     return wrapper
 
 
 class SortingAlgorithms:
-    """Collection of sorting algorithms."""
+    """Collection of sorting algorithms.
+
+    Methods with an inplace flag copy the input by default; inplace=True
+    sorts and returns the caller's list itself, saving the O(n) copy.
+    """
+
+    # Consecutive wins by one side of a Tim Sort merge before galloping
+    MIN_GALLOP = 7
+
+    # Below this many elements parallel_merge_sort just calls sorted()
+    PARALLEL_THRESHOLD = 100_000
 
     @staticmethod
-    def bubble_sort(arr: List[int]) -> List[int]:
+    def bubble_sort(arr: List[int], inplace: bool = False) -> List[int]:
         """
         Bubble Sort - O(n²) time, O(1) space
 
         Repeatedly steps through the list, compares adjacent elements
         and swaps them if they are in wrong order.
         """
-        arr = arr.copy()
+        if not inplace:
+            arr = arr.copy()
         n = len(arr)
 
         for i in range(n):
@@ -49,14 +66,15 @@ class SortingAlgorithms:
         return arr
 
     @staticmethod
-    def selection_sort(arr: List[int]) -> List[int]:
+    def selection_sort(arr: List[int], inplace: bool = False) -> List[int]:
         """
         Selection Sort - O(n²) time, O(1) space
 
         Divides input into sorted and unsorted regions.
         Repeatedly selects the smallest element from unsorted region.
         """
-        arr = arr.copy()
+        if not inplace:
+            arr = arr.copy()
         n = len(arr)
 
         for i in range(n):
@@ -70,14 +88,15 @@ class SortingAlgorithms:
         return arr
 
     @staticmethod
-    def insertion_sort(arr: List[int]) -> List[int]:
+    def insertion_sort(arr: List[int], inplace: bool = False) -> List[int]:
         """
         Insertion Sort - O(n²) time, O(1) space
 
         Builds the final sorted array one item at a time.
         Efficient for small data sets and nearly sorted data.
         """
-        arr = arr.copy()
+        if not inplace:
+            arr = arr.copy()
         n = len(arr)
 
         for i in range(1, n):
@@ -93,68 +112,178 @@ class SortingAlgorithms:
         return arr
 
     @staticmethod
-    def merge_sort(arr: List[int]) -> List[int]:
+    def merge_sort(arr: List[int], fast: bool = True) -> List[int]:
         """
         Merge Sort - O(n log n) time, O(n) space
 
-        Divide and conquer algorithm that divides array into halves,
-        recursively sorts them, and merges the sorted halves.
+        Merges sorted runs of doubling width (bottom-up, no recursion),
+        ping-ponging between two preallocated buffers.
+        With fast=True uses the built-in sorted() (Timsort, a stable
+        natural merge sort in C); fast=False runs the Python version.
         """
-        if len(arr) <= 1:
-            return arr
+        if fast:
+            return sorted(arr)
 
-        mid = len(arr) // 2
-        left = SortingAlgorithms.merge_sort(arr[:mid])
-        right = SortingAlgorithms.merge_sort(arr[mid:])
+        # Bottom-up: merge runs of width 1, 2, 4, ... between two buffers,
+        # swapping source and target each pass instead of slicing per level
+        n = len(arr)
+        src = list(arr)
+        tgt = [None] * n
+        width = 1
+
+        while width < n:
+            for lo in range(0, n, 2 * width):
+                SortingAlgorithms._merge(src, tgt, lo,
+                                         min(lo + width, n), min(lo + 2 * width, n))
+            src, tgt = tgt, src
+            width *= 2
 
-        return SortingAlgorithms._merge(left, right)
+        return src
 
     @staticmethod
-    def _merge(left: List[int], right: List[int]) -> List[int]:
-        """Merge two sorted arrays."""
-        result = []
-        i = j = 0
-
-        while i < len(left) and j < len(right):
-            if left[i] <= right[j]:
-                result.append(left[i])
-                i += 1
-            else:
-                result.append(right[j])
-                j += 1
+    def parallel_merge_sort(arr: List[int], workers: int = None) -> List[int]:
+        """
+        Parallel Merge Sort - O((n/P) log(n/P)) per worker + O(n log P) merge
 
-        result.extend(left[i:])
-        result.extend(right[j:])
+        Splits the input into one chunk per worker process, sorts the
+        chunks with sorted() in a multiprocessing Pool, then merges the P
+        sorted runs. Inputs under PARALLEL_THRESHOLD, or a single worker,
+        fall back to sorted() since pickling chunks to and from the workers
+        would cost more than it saves. Elements must be picklable.
+        """
+        workers = workers or os.cpu_count() or 1
+        n = len(arr)
+        if n < SortingAlgorithms.PARALLEL_THRESHOLD or workers < 2:
+            return sorted(arr)
 
-        return result
+        chunk = -(-n // workers)
+        with Pool(workers) as pool:
+            runs = pool.map(sorted, [arr[i:i + chunk] for i in range(0, n, chunk)])
+
+        # sorted() detects the P runs and merges them in C with galloping,
+        # several times faster than the pure-Python heapq.merge
+        return sorted(chain.from_iterable(runs))
+
+    @staticmethod
+    def _merge(src: List[int], tgt: List[int], lo: int, mid: int, hi: int):
+        """Merge sorted src[lo:mid] and src[mid:hi] into tgt[lo:hi]."""
+        i, j, k = lo, mid, lo
+
+        if mid < hi:
+            # Keep the current head of each side in a local
+            x, y = src[i], src[j]
+            while True:
+                if x <= y:
+                    tgt[k] = x
+                    k += 1
+                    i += 1
+                    if i == mid:
+                        break
+                    x = src[i]
+                else:
+                    tgt[k] = y
+                    k += 1
+                    j += 1
+                    if j == hi:
+                        break
+                    y = src[j]
+
+        # At most one side has elements left
+        if i < mid:
+            tgt[k:hi] = src[i:mid]
+        else:
+            tgt[k:hi] = src[j:hi]
 
     @staticmethod
-    def quick_sort(arr: List[int]) -> List[int]:
+    def quick_sort(arr: List[int], fast: bool = True,
+                   inplace: bool = False) -> List[int]:
         """
         Quick Sort - O(n log n) average, O(n²) worst, O(log n) space
 
-        Picks a pivot element and partitions array around it.
-        Recursively sorts the partitions.
+        Picks a median-of-three pivot and partitions the array around it
+        in place (Hoare), keeping pending ranges on an explicit stack;
+        ranges under 16 elements are finished by insertion sort.
+        With fast=True uses the built-in sorted() instead; fast=False runs
+        the Python version.
         """
-        if len(arr) <= 1:
-            return arr
-
-        pivot = arr[len(arr) // 2]
-        left = [x for x in arr if x < pivot]
-        middle = [x for x in arr if x == pivot]
-        right = [x for x in arr if x > pivot]
+        if fast:
+            if inplace:
+                arr.sort()
+                return arr
+            return sorted(arr)
+
+        if not inplace:
+            arr = arr.copy()
+        stack = [(0, len(arr) - 1)]
+
+        while stack:
+            lo, hi = stack.pop()
+
+            # Small ranges: insertion sort beats further partitioning
+            if hi - lo < 16:
+                for i in range(lo + 1, hi + 1):
+                    key = arr[i]
+                    j = i - 1
+                    while j >= lo and arr[j] > key:
+                        arr[j + 1] = arr[j]
+                        j -= 1
+                    arr[j + 1] = key
+                continue
+
+            # Median-of-three pivot keeps sorted/reversed input O(n log n)
+            mid = (lo + hi) // 2
+            if arr[mid] < arr[lo]:
+                arr[lo], arr[mid] = arr[mid], arr[lo]
+            if arr[hi] < arr[lo]:
+                arr[lo], arr[hi] = arr[hi], arr[lo]
+            if arr[hi] < arr[mid]:
+                arr[mid], arr[hi] = arr[hi], arr[mid]
+            pivot = arr[mid]
+
+            # Hoare partition in place
+            i, j = lo, hi
+            while i <= j:
+                while arr[i] < pivot:
+                    i += 1
+                while arr[j] > pivot:
+                    j -= 1
+                if i <= j:
+                    arr[i], arr[j] = arr[j], arr[i]
+                    i += 1
+                    j -= 1
+
+            # Push the larger side first so the stack stays O(log n)
+            if j - lo > hi - i:
+                stack.append((lo, j))
+                stack.append((i, hi))
+            else:
+                stack.append((i, hi))
+                stack.append((lo, j))
 
-        return SortingAlgorithms.quick_sort(left) + middle + SortingAlgorithms.quick_sort(right)
+        return arr
 
     @staticmethod
-    def heap_sort(arr: List[int]) -> List[int]:
+    def heap_sort(arr: List[int], fast: bool = True,
+                  inplace: bool = False) -> List[int]:
         """
         Heap Sort - O(n log n) time, O(1) space
 
         Uses binary heap data structure to sort.
         Builds a max heap and repeatedly extracts maximum.
+        With fast=True the heap is built and drained by heapq (a C min-heap,
+        O(n) extra space); fast=False runs the in-place Python version.
         """
-        arr = arr.copy()
+        if fast:
+            heap = arr if inplace else list(arr)
+            heapq.heapify(heap)
+            result = [heapq.heappop(heap) for _ in range(len(heap))]
+            if inplace:
+                arr[:] = result
+                return arr
+            return result
+
+        if not inplace:
+            arr = arr.copy()
         n = len(arr)
 
         # Build max heap
@@ -171,22 +300,171 @@ class SortingAlgorithms:
     @staticmethod
     def _heapify(arr: List[int], n: int, i: int):
         """Heapify subtree rooted at index i."""
-        largest = i
-        left = 2 * i + 1
-        right = 2 * i + 2
+        # Sift down iteratively: carry the root value down the hole and
+        # write it once, instead of swapping and recursing at every level
+        item = arr[i]
+        child = 2 * i + 1
+
+        while child < n:
+            right = child + 1
+            if right < n and arr[right] > arr[child]:
+                child = right
+
+            if arr[child] <= item:
+                break
+
+            arr[i] = arr[child]
+            i = child
+            child = 2 * i + 1
+
+        arr[i] = item
+
+    @staticmethod
+    def tim_sort(arr: List[int], inplace: bool = False) -> List[int]:
+        """
+        Tim Sort - O(n log n) time, O(n) space, O(n) on presorted runs
+
+        Natural merge sort: scans for ascending or strictly descending runs
+        (reversing the latter), extends short runs to minrun with binary
+        insertion sort, and merges runs from a stack whose lengths are kept
+        roughly balanced. Merges gallop with bisect once one side wins
+        MIN_GALLOP comparisons in a row. Sorted, reversed and all-equal
+        input is a single run found in n - 1 comparisons.
+        """
+        if not inplace:
+            arr = arr.copy()
+        n = len(arr)
+        if n < 2:
+            return arr
 
-        if left < n and arr[left] > arr[largest]:
-            largest = left
+        # minrun: the top 6 bits of n, plus 1 if any lower bit is set, so
+        # n / minrun is a power of 2 or just below one
+        min_run, r = n, 0
+        while min_run >= 64:
+            r |= min_run & 1
+            min_run >>= 1
+        min_run += r
+
+        runs = []  # pending runs as [base, length]
+
+        def merge_at(i: int):
+            (base_a, len_a), (base_b, len_b) = runs[i], runs[i + 1]
+            runs[i][1] = len_a + len_b
+            del runs[i + 1]
+            SortingAlgorithms._merge_runs(arr, base_a, len_a, base_b, len_b)
+
+        lo = 0
+        while lo < n:
+            run_len = SortingAlgorithms._count_run(arr, lo, n)
+            if run_len < min_run:
+                forced = min(min_run, n - lo)
+                SortingAlgorithms._binary_insertion_sort(arr, lo, lo + forced,
+                                                         lo + run_len)
+                run_len = forced
+            runs.append([lo, run_len])
+            lo += run_len
+
+            # Restore the stack invariants: for the top runs X, Y, Z
+            # (Z newest) keep X > Y + Z and Y > Z
+            while len(runs) > 1:
+                i = len(runs) - 2
+                if ((i > 0 and runs[i - 1][1] <= runs[i][1] + runs[i + 1][1]) or
+                        (i > 1 and runs[i - 2][1] <= runs[i - 1][1] + runs[i][1])):
+                    if runs[i - 1][1] < runs[i + 1][1]:
+                        i -= 1
+                elif runs[i][1] > runs[i + 1][1]:
+                    break
+                merge_at(i)
+
+        while len(runs) > 1:
+            i = len(runs) - 2
+            if i > 0 and runs[i - 1][1] < runs[i + 1][1]:
+                i -= 1
+            merge_at(i)
 
-        if right < n and arr[right] > arr[largest]:
-            largest = right
+        return arr
 
-        if largest != i:
-            arr[i], arr[largest] = arr[largest], arr[i]
-            SortingAlgorithms._heapify(arr, n, largest)
+    @staticmethod
+    def _count_run(arr: List[int], lo: int, hi: int) -> int:
+        """Length of the run starting at lo; strictly descending runs are reversed."""
+        run_hi = lo + 1
+        if run_hi == hi:
+            return 1
+
+        if arr[run_hi] < arr[lo]:
+            # Strictly descending, so reversing keeps the sort stable
+            run_hi += 1
+            while run_hi < hi and arr[run_hi] < arr[run_hi - 1]:
+                run_hi += 1
+            arr[lo:run_hi] = arr[lo:run_hi][::-1]
+        else:
+            run_hi += 1
+            while run_hi < hi and not arr[run_hi] < arr[run_hi - 1]:
+                run_hi += 1
+
+        return run_hi - lo
+
+    @staticmethod
+    def _binary_insertion_sort(arr: List[int], lo: int, hi: int, start: int):
+        """Insertion-sort arr[lo:hi], where arr[lo:start] is already sorted."""
+        for i in range(start, hi):
+            pivot = arr[i]
+            pos = bisect_right(arr, pivot, lo, i)
+            if pos < i:
+                # Shift the gap with one slice copy (only within the run)
+                arr[pos + 1:i + 1] = arr[pos:i]
+                arr[pos] = pivot
+
+    @staticmethod
+    def _merge_runs(arr: List[int], base_a: int, len_a: int,
+                    base_b: int, len_b: int):
+        """Stably merge adjacent sorted runs arr[base_a:base_b] and arr[base_b:base_b + len_b]."""
+        # Elements of A that are <= B's first element, and elements of B
+        # that are >= A's last element, are already in place
+        start = bisect_right(arr, arr[base_b], base_a, base_b)
+        if start == base_b:
+            return
+        end_b = bisect_left(arr, arr[base_b - 1], base_b, base_b + len_b)
+
+        tmp = arr[start:base_b]
+        len_tmp = len(tmp)
+        i, j, dest = 0, base_b, start
+        wins_a = wins_b = 0
+        min_gallop = SortingAlgorithms.MIN_GALLOP
+
+        while i < len_tmp and j < end_b:
+            if arr[j] < tmp[i]:
+                arr[dest] = arr[j]
+                dest += 1
+                j += 1
+                wins_b += 1
+                wins_a = 0
+                if wins_b >= min_gallop:
+                    # Copy every B element still below A's head at once
+                    k = bisect_left(arr, tmp[i], j, end_b)
+                    arr[dest:dest + k - j] = arr[j:k]
+                    dest += k - j
+                    j = k
+                    wins_b = 0
+            else:
+                arr[dest] = tmp[i]
+                dest += 1
+                i += 1
+                wins_a += 1
+                wins_b = 0
+                if wins_a >= min_gallop and i < len_tmp:
+                    # Copy every A element not above B's head at once
+                    k = bisect_right(tmp, arr[j], i, len_tmp)
+                    arr[dest:dest + k - i] = tmp[i:k]
+                    dest += k - i
+                    i = k
+                    wins_a = 0
+
+        # Leftover B elements are already in place; leftover A fills the gap
+        arr[dest:dest + len_tmp - i] = tmp[i:]
 
     @staticmethod
-    def counting_sort(arr: List[int]) -> List[int]:
+    def counting_sort(arr: List[int], inplace: bool = False) -> List[int]:
         """
         Counting Sort - O(n + k) time, O(k) space
 
@@ -198,25 +476,18 @@ class SortingAlgorithms:
 
         max_val = max(arr)
         min_val = min(arr)
-        range_size = max_val - min_val + 1
-
-        count = [0] * range_size
-        output = [0] * len(arr)
-
-        # Count occurrences
-        for num in arr:
-            count[num - min_val] += 1
 
-        # Calculate cumulative count
-        for i in range(1, len(count)):
-            count[i] += count[i - 1]
+        # Count occurrences (Counter counts in C)
+        count = Counter(arr)
 
-        # Build output array
-        for num in reversed(arr):
-            output[count[num - min_val] - 1] = num
-            count[num - min_val] -= 1
-
-        return output
+        # Emit each value in the range as many times as it occurred; a
+        # missing value counts as 0 and repeat(value, 0) emits nothing
+        values = range(min_val, max_val + 1)
+        result = chain.from_iterable(map(repeat, values, map(count.__getitem__, values)))
+        if inplace:
+            arr[:] = result
+            return arr
+        return list(result)
 
     @staticmethod
     def radix_sort(arr: List[int]) -> List[int]:
@@ -224,43 +495,32 @@ class SortingAlgorithms:
         Radix Sort - O(d * (n + k)) time
 
         Non-comparative sorting algorithm.
-        Sorts integers by processing individual digits.
+        Sorts non-negative integers by processing one byte (base 256) per
+        pass, least significant first: 4 passes cover 32-bit values where
+        base-10 digits needed 10.
         """
         if not arr:
             return arr
 
         max_val = max(arr)
-        exp = 1
+        shift = 0
 
-        while max_val // exp > 0:
-            arr = SortingAlgorithms._counting_sort_by_digit(arr, exp)
-            exp *= 10
+        while max_val >> shift > 0:
+            arr = SortingAlgorithms._sort_by_byte(arr, shift)
+            shift += 8
 
         return arr
 
     @staticmethod
-    def _counting_sort_by_digit(arr: List[int], exp: int) -> List[int]:
-        """Helper for radix sort - sorts by specific digit."""
-        n = len(arr)
-        output = [0] * n
-        count = [0] * 10
+    def _sort_by_byte(arr: List[int], shift: int) -> List[int]:
+        """Helper for radix sort - stable distribution by one byte."""
+        buckets = [[] for _ in range(256)]
+        append_to = [bucket.append for bucket in buckets]
 
-        # Count occurrences
         for num in arr:
-            index = (num // exp) % 10
-            count[index] += 1
+            append_to[num >> shift & 0xFF](num)
 
-        # Cumulative count
-        for i in range(1, 10):
-            count[i] += count[i - 1]
-
-        # Build output
-        for i in range(n - 1, -1, -1):
-            index = (arr[i] // exp) % 10
-            output[count[index] - 1] = arr[i]
-            count[index] -= 1
-
-        return output
+        return list(chain.from_iterable(buckets))
 
     @staticmethod
     def bucket_sort(arr: List[float], bucket_count: int = 10) -> List[float]:
@@ -275,25 +535,23 @@ class SortingAlgorithms:
 
         # Create buckets
         buckets = [[] for _ in range(bucket_count)]
+        append_to = [bucket.append for bucket in buckets]
 
-        # Distribute elements
+        # Distribute elements: the scale factor is computed once, so each
+        # element costs one multiply instead of a divide and a range check
         max_val = max(arr)
         min_val = min(arr)
         range_size = max_val - min_val
 
+        if range_size == 0:
+            return list(arr)
+
+        scale = (bucket_count - 1) / range_size
         for num in arr:
-            if range_size == 0:
-                index = 0
-            else:
-                index = int((num - min_val) / range_size * (bucket_count - 1))
-            buckets[index].append(num)
+            append_to[int((num - min_val) * scale)](num)
 
         # Sort buckets and concatenate
-        result = []
-        for bucket in buckets:
-            result.extend(sorted(bucket))
-
-        return result
+        return list(chain.from_iterable(map(sorted, buckets)))
 
 
 def demo():
@@ -313,8 +571,12 @@ def demo():
         ("Selection Sort", SortingAlgorithms.selection_sort),
         ("Insertion Sort", SortingAlgorithms.insertion_sort),
         ("Merge Sort", SortingAlgorithms.merge_sort),
+        ("Merge Sort (Python)", partial(SortingAlgorithms.merge_sort, fast=False)),
         ("Quick Sort", SortingAlgorithms.quick_sort),
+        ("Quick Sort (Python)", partial(SortingAlgorithms.quick_sort, fast=False)),
         ("Heap Sort", SortingAlgorithms.heap_sort),
+        ("Heap Sort (Python)", partial(SortingAlgorithms.heap_sort, fast=False)),
+        ("Tim Sort", SortingAlgorithms.tim_sort),
         ("Counting Sort", SortingAlgorithms.counting_sort),
         ("Radix Sort", SortingAlgorithms.radix_sort),
     ]
@@ -13,8 +13,8 @@ Demonstrates:
 """
 
 import sqlite3
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+import threading
+from typing import List, Dict, Any, Optional, Iterable, Tuple
 from contextlib import contextmanager
 import json
 
@@ -22,36 +22,111 @@ import json
 class Database:
     """SQLite database manager with migrations and utilities."""
 
+    # Number of migrations in run_migrations; stored in PRAGMA user_version
+    SCHEMA_VERSION = 7
+
     def __init__(self, db_path: str = 'app.db'):
         self.db_path = db_path
         self.connection = None
         self.migrations_run = False
+        self._local = threading.local()
+        # Every thread's connection, so close() can reach all of them
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use.
+
+        Each thread gets its own connection. With ':memory:' that means
+        each thread sees its own, separate empty database; use a file path
+        to share data between threads.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # Larger statement cache: every repository query stays prepared.
+            # A connection is only ever used by the thread that opened it;
+            # check_same_thread=False just lets close() run from any thread.
+            conn = sqlite3.connect(self.db_path, cached_statements=512,
+                                   check_same_thread=False)
+            conn.row_factory = sqlite3.Row  # Return rows as dictionaries
+            # Per-connection settings: with WAL, NORMAL sync skips the
+            # fsync on each commit; temp tables, a 64 MiB page cache and
+            # 256 MiB of memory-mapped I/O keep reads off the syscall path
+            conn.execute('PRAGMA synchronous = NORMAL')
+            conn.execute('PRAGMA temp_store = MEMORY')
+            conn.execute('PRAGMA cache_size = -65536')
+            conn.execute('PRAGMA mmap_size = 268435456')
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
 
     @contextmanager
     def get_connection(self):
-        """Context manager for database connections."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Return rows as dictionaries
+        """Context manager for a transaction on the cached connection."""
+        conn = self._connect()
         try:
             yield conn
             conn.commit()
         except Exception:
             conn.rollback()
             raise
+
+    def snapshot(self, path: str):
+        """Write a compacted copy of the database to a new file at path.
+
+        Useful for seeding in ':memory:' and materializing the result on
+        disk in one sequential write.
+        """
+        with self.get_connection() as conn:
+            conn.execute('VACUUM INTO ?', (path,))
+
+        # VACUUM INTO writes the copy in rollback-journal mode; switch it to
+        # WAL like databases created by run_migrations
+        target = sqlite3.connect(path)
+        try:
+            target.execute('PRAGMA journal_mode = WAL')
         finally:
+            target.close()
+
+    def close(self):
+        """Close the connections of all threads.
+
+        Call it once no other thread is using the database; a thread that
+        uses it again afterwards opens a new connection.
+        """
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+            # Fresh thread-local storage, so no thread keeps a closed connection
+            self._local = threading.local()
+        for conn in connections:
             conn.close()
 
     def initialize(self):
         """Initialize database with schema."""
         if not self.migrations_run:
-            self.run_migrations()
+            # user_version is read from the database header, so an
+            # up-to-date schema costs one PRAGMA instead of a query per
+            # migration
+            if self.schema_version() < self.SCHEMA_VERSION:
+                self.run_migrations()
             self.migrations_run = True
 
+    def schema_version(self) -> int:
+        """Return the schema version recorded in the database file."""
+        with self.get_connection() as conn:
+            return conn.execute('PRAGMA user_version').fetchone()[0]
+
     def run_migrations(self):
         """Run database migrations."""
         with self.get_connection() as conn:
             cursor = conn.cursor()
 
+            # Write-ahead logging lets readers run alongside the writer.
+            # Unlike the per-connection PRAGMAs this is stored in the
+            # database file, so it only needs setting once.
+            cursor.execute('PRAGMA journal_mode = WAL')
+
             # Create migrations table
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS migrations (
@@ -61,9 +136,13 @@ class Database:
                 )
             ''')
 
+            # Each migration runs its DDL as one script inside an explicit
+            # transaction that also records it, so a failed migration
+            # leaves neither a partial schema nor a migrations row behind
             # Migration 1: Create users table
             if not self._migration_executed('create_users_table', cursor):
-                cursor.execute('''
+                cursor.executescript('''
+                    BEGIN;
                     CREATE TABLE users (
                         id INTEGER PRIMARY KEY AUTOINCREMENT,
                         username TEXT NOT NULL UNIQUE,
@@ -73,18 +152,18 @@ class Database:
                         is_active BOOLEAN DEFAULT 1,
                         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                         updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                ''')
-
-                # Create indexes
-                cursor.execute('CREATE INDEX idx_users_email ON users(email)')
-                cursor.execute('CREATE INDEX idx_users_username ON users(username)')
+                    );
 
+                    CREATE INDEX idx_users_email ON users(email);
+                    CREATE INDEX idx_users_username ON users(username);
+                ''')
                 self._record_migration('create_users_table', cursor)
+                conn.commit()
 
             # Migration 2: Create posts table
             if not self._migration_executed('create_posts_table', cursor):
-                cursor.execute('''
+                cursor.executescript('''
+                    BEGIN;
                     CREATE TABLE posts (
                         id INTEGER PRIMARY KEY AUTOINCREMENT,
                         user_id INTEGER NOT NULL,
@@ -95,32 +174,34 @@ class Database:
                         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                         updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                         FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
-                    )
-                ''')
-
-                cursor.execute('CREATE INDEX idx_posts_user_id ON posts(user_id)')
-                cursor.execute('CREATE INDEX idx_posts_status ON posts(status)')
+                    );
 
+                    CREATE INDEX idx_posts_user_id ON posts(user_id);
+                    CREATE INDEX idx_posts_status ON posts(status);
+                ''')
                 self._record_migration('create_posts_table', cursor)
+                conn.commit()
 
             # Migration 3: Create tags table
             if not self._migration_executed('create_tags_table', cursor):
-                cursor.execute('''
+                cursor.executescript('''
+                    BEGIN;
                     CREATE TABLE tags (
                         id INTEGER PRIMARY KEY AUTOINCREMENT,
                         name TEXT NOT NULL UNIQUE,
                         slug TEXT NOT NULL UNIQUE,
                         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                ''')
-
-                cursor.execute('CREATE INDEX idx_tags_slug ON tags(slug)')
+                    );
 
+                    CREATE INDEX idx_tags_slug ON tags(slug);
+                ''')
                 self._record_migration('create_tags_table', cursor)
+                conn.commit()
 
             # Migration 4: Create post_tags junction table
             if not self._migration_executed('create_post_tags_table', cursor):
-                cursor.execute('''
+                cursor.executescript('''
+                    BEGIN;
                     CREATE TABLE post_tags (
                         post_id INTEGER NOT NULL,
                         tag_id INTEGER NOT NULL,
@@ -128,14 +209,15 @@ class Database:
                         PRIMARY KEY (post_id, tag_id),
                         FOREIGN KEY (post_id) REFERENCES posts(id) ON DELETE CASCADE,
                         FOREIGN KEY (tag_id) REFERENCES tags(id) ON DELETE CASCADE
-                    )
+                    );
                 ''')
-
                 self._record_migration('create_post_tags_table', cursor)
+                conn.commit()
 
             # Migration 5: Create comments table
             if not self._migration_executed('create_comments_table', cursor):
-                cursor.execute('''
+                cursor.executescript('''
+                    BEGIN;
                     CREATE TABLE comments (
                         id INTEGER PRIMARY KEY AUTOINCREMENT,
                         post_id INTEGER NOT NULL,
@@ -144,12 +226,53 @@ class Database:
                         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                         FOREIGN KEY (post_id) REFERENCES posts(id) ON DELETE CASCADE,
                         FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
-                    )
-                ''')
-
-                cursor.execute('CREATE INDEX idx_comments_post_id ON comments(post_id)')
+                    );
 
+                    CREATE INDEX idx_comments_post_id ON comments(post_id);
+                ''')
                 self._record_migration('create_comments_table', cursor)
+                conn.commit()
+
+            # Migration 6: Covering indexes for per-user statistics
+            if not self._migration_executed('add_user_stats_indexes', cursor):
+                cursor.executescript('''
+                    BEGIN;
+                    CREATE INDEX idx_posts_user_views ON posts(user_id, view_count);
+                    CREATE INDEX idx_comments_user_id ON comments(user_id);
+                ''')
+                self._record_migration('add_user_stats_indexes', cursor)
+                conn.commit()
+
+            # Migration 7: Denormalized tag post counts kept by triggers
+            if not self._migration_executed('add_tags_post_count', cursor):
+                cursor.executescript('''
+                    BEGIN;
+                    ALTER TABLE tags ADD COLUMN post_count INTEGER NOT NULL DEFAULT 0;
+
+                    UPDATE tags SET post_count = (
+                        SELECT COUNT(*) FROM post_tags WHERE tag_id = tags.id
+                    );
+
+                    CREATE TRIGGER incr_tag_post_count
+                    AFTER INSERT ON post_tags
+                    BEGIN
+                        UPDATE tags SET post_count = post_count + 1
+                        WHERE id = NEW.tag_id;
+                    END;
+
+                    CREATE TRIGGER decr_tag_post_count
+                    AFTER DELETE ON post_tags
+                    BEGIN
+                        UPDATE tags SET post_count = post_count - 1
+                        WHERE id = OLD.tag_id;
+                    END;
+
+                    CREATE INDEX idx_tags_post_count ON tags(post_count DESC);
+                ''')
+                self._record_migration('add_tags_post_count', cursor)
+                conn.commit()
+
+            cursor.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION}')
 
             conn.commit()
 
@@ -166,6 +289,10 @@ class Database:
 class UserRepository:
     """Repository for User operations."""
 
+    UPDATABLE_COLUMNS = frozenset(
+        {'username', 'email', 'password_hash', 'full_name', 'is_active'}
+    )
+
     def __init__(self, db: Database):
         self.db = db
 
@@ -180,20 +307,36 @@ class UserRepository:
             ''', (username, email, password_hash, full_name))
             return cursor.lastrowid
 
+    def create_many(self, rows: Iterable[Tuple[str, str, str, Optional[str]]]) -> List[int]:
+        """Create users from (username, email, password_hash, full_name) rows.
+
+        All rows are inserted in one transaction with executemany; returns
+        the new IDs in row order.
+        """
+        rows = list(rows)
+        with self.db.get_connection() as conn:
+            conn.executemany('''
+                INSERT INTO users (username, email, password_hash, full_name)
+                VALUES (?, ?, ?, ?)
+            ''', rows)
+            # AUTOINCREMENT IDs of one transaction's inserts are consecutive
+            last_id = conn.execute('SELECT last_insert_rowid()').fetchone()[0]
+            return list(range(last_id - len(rows) + 1, last_id + 1))
+
     def find_by_id(self, user_id: int) -> Optional[Dict[str, Any]]:
         """Find user by ID."""
         with self.db.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('SELECT * FROM users WHERE id = ?', (user_id,))
-            row = cursor.fetchone()
+            row = conn.execute(
+                'SELECT * FROM users WHERE id = ?', (user_id,)
+            ).fetchone()
             return dict(row) if row else None
 
     def find_by_email(self, email: str) -> Optional[Dict[str, Any]]:
         """Find user by email."""
         with self.db.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('SELECT * FROM users WHERE email = ?', (email,))
-            row = cursor.fetchone()
+            row = conn.execute(
+                'SELECT * FROM users WHERE email = ?', (email,)
+            ).fetchone()
             return dict(row) if row else None
 
     def find_all(self, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
@@ -211,14 +354,22 @@ class UserRepository:
         if not kwargs:
             return False
 
-        kwargs['updated_at'] = datetime.now()
+        unknown = kwargs.keys() - self.UPDATABLE_COLUMNS
+        if unknown:
+            raise ValueError(f"Cannot update user columns: {', '.join(sorted(unknown))}")
 
-        fields = ', '.join(f'{k} = ?' for k in kwargs.keys())
-        values = list(kwargs.values()) + [user_id]
+        # Sorted column names give one SQL string per column set, so
+        # repeated updates reuse the cached prepared statement
+        keys = sorted(kwargs)
+        fields = ', '.join(f'{k} = ?' for k in keys)
+        values = [kwargs[k] for k in keys] + [user_id]
 
         with self.db.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(f'UPDATE users SET {fields} WHERE id = ?', values)
+            cursor.execute(
+                f'UPDATE users SET {fields}, updated_at = CURRENT_TIMESTAMP WHERE id = ?',
+                values
+            )
             return cursor.rowcount > 0
 
     def delete(self, user_id: int) -> bool:
@@ -233,32 +384,17 @@ class UserRepository:
         with self.db.get_connection() as conn:
             cursor = conn.cursor()
 
-            # Get post count
-            cursor.execute(
-                'SELECT COUNT(*) as count FROM posts WHERE user_id = ?',
-                (user_id,)
-            )
-            post_count = cursor.fetchone()['count']
-
-            # Get comment count
-            cursor.execute(
-                'SELECT COUNT(*) as count FROM comments WHERE user_id = ?',
-                (user_id,)
-            )
-            comment_count = cursor.fetchone()['count']
-
-            # Get total views
-            cursor.execute(
-                'SELECT SUM(view_count) as total FROM posts WHERE user_id = ?',
-                (user_id,)
-            )
-            total_views = cursor.fetchone()['total'] or 0
+            # One round-trip: each count is a scalar subquery served by
+            # the user_id indexes
+            cursor.execute('''
+                SELECT
+                    (SELECT COUNT(*) FROM posts WHERE user_id = ?) as post_count,
+                    (SELECT COUNT(*) FROM comments WHERE user_id = ?) as comment_count,
+                    (SELECT COALESCE(SUM(view_count), 0) FROM posts WHERE user_id = ?)
+                        as total_views
+            ''', (user_id, user_id, user_id))
 
-            return {
-                'post_count': post_count,
-                'comment_count': comment_count,
-                'total_views': total_views
-            }
+            return dict(cursor.fetchone())
 
 
 class PostRepository:
@@ -278,6 +414,22 @@ class PostRepository:
             ''', (user_id, title, content, status))
             return cursor.lastrowid
 
+    def create_many(self, rows: Iterable[Tuple[int, str, str, str]]) -> List[int]:
+        """Create posts from (user_id, title, content, status) rows.
+
+        All rows are inserted in one transaction with executemany; returns
+        the new IDs in row order.
+        """
+        rows = list(rows)
+        with self.db.get_connection() as conn:
+            conn.executemany('''
+                INSERT INTO posts (user_id, title, content, status)
+                VALUES (?, ?, ?, ?)
+            ''', rows)
+            # AUTOINCREMENT IDs of one transaction's inserts are consecutive
+            last_id = conn.execute('SELECT last_insert_rowid()').fetchone()[0]
+            return list(range(last_id - len(rows) + 1, last_id + 1))
+
     def find_by_id(self, post_id: int) -> Optional[Dict[str, Any]]:
         """Find post by ID with user information."""
         with self.db.get_connection() as conn:
@@ -291,29 +443,49 @@ class PostRepository:
             row = cursor.fetchone()
             return dict(row) if row else None
 
+    def find_with_tags(self, post_id: int) -> Optional[Dict[str, Any]]:
+        """Find post by ID with user information and tag names in one query.
+
+        Tag names come back under 'tags', joined in SQL with the ASCII unit
+        separator (char(31)) so names containing commas split cleanly.
+        """
+        with self.db.get_connection() as conn:
+            row = conn.execute('''
+                SELECT p.*, u.username, u.full_name,
+                       (SELECT GROUP_CONCAT(name, char(31))
+                        FROM (SELECT t.name
+                              FROM post_tags pt
+                              JOIN tags t ON t.id = pt.tag_id
+                              WHERE pt.post_id = p.id
+                              ORDER BY t.id)) as tag_names
+                FROM posts p
+                JOIN users u ON p.user_id = u.id
+                WHERE p.id = ?
+            ''', (post_id,)).fetchone()
+
+            if not row:
+                return None
+
+            post = dict(row)
+            tag_names = post.pop('tag_names')
+            post['tags'] = tag_names.split('\x1f') if tag_names else []
+            return post
+
     def find_all(self, status: Optional[str] = None,
                  limit: int = 10, offset: int = 0) -> List[Dict[str, Any]]:
         """Get posts with optional status filter."""
         with self.db.get_connection() as conn:
             cursor = conn.cursor()
 
-            if status:
-                cursor.execute('''
-                    SELECT p.*, u.username
-                    FROM posts p
-                    JOIN users u ON p.user_id = u.id
-                    WHERE p.status = ?
-                    ORDER BY p.created_at DESC
-                    LIMIT ? OFFSET ?
-                ''', (status, limit, offset))
-            else:
-                cursor.execute('''
-                    SELECT p.*, u.username
-                    FROM posts p
-                    JOIN users u ON p.user_id = u.id
-                    ORDER BY p.created_at DESC
-                    LIMIT ? OFFSET ?
-                ''', (limit, offset))
+            # One statement serves both cases: a NULL status matches every post
+            cursor.execute('''
+                SELECT p.*, u.username
+                FROM posts p
+                JOIN users u ON p.user_id = u.id
+                WHERE (:status IS NULL OR p.status = :status)
+                ORDER BY p.created_at DESC
+                LIMIT :limit OFFSET :offset
+            ''', {'status': status or None, 'limit': limit, 'offset': offset})
 
             return [dict(row) for row in cursor.fetchall()]
 
@@ -331,8 +503,7 @@ class PostRepository:
     def increment_views(self, post_id: int):
         """Increment post view count."""
         with self.db.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
+            conn.execute(
                 'UPDATE posts SET view_count = view_count + 1 WHERE id = ?',
                 (post_id,)
             )
@@ -340,12 +511,10 @@ class PostRepository:
     def add_tags(self, post_id: int, tag_ids: List[int]):
         """Add tags to post."""
         with self.db.get_connection() as conn:
-            cursor = conn.cursor()
-            for tag_id in tag_ids:
-                cursor.execute('''
-                    INSERT OR IGNORE INTO post_tags (post_id, tag_id)
-                    VALUES (?, ?)
-                ''', (post_id, tag_id))
+            conn.executemany('''
+                INSERT OR IGNORE INTO post_tags (post_id, tag_id)
+                VALUES (?, ?)
+            ''', [(post_id, tag_id) for tag_id in tag_ids])
 
     def get_post_tags(self, post_id: int) -> List[Dict[str, Any]]:
         """Get tags for a post."""
@@ -376,6 +545,19 @@ class TagRepository:
             )
             return cursor.lastrowid
 
+    def create_many(self, rows: Iterable[Tuple[str, str]]) -> List[int]:
+        """Create tags from (name, slug) rows.
+
+        All rows are inserted in one transaction with executemany; returns
+        the new IDs in row order.
+        """
+        rows = list(rows)
+        with self.db.get_connection() as conn:
+            conn.executemany('INSERT INTO tags (name, slug) VALUES (?, ?)', rows)
+            # AUTOINCREMENT IDs of one transaction's inserts are consecutive
+            last_id = conn.execute('SELECT last_insert_rowid()').fetchone()[0]
+            return list(range(last_id - len(rows) + 1, last_id + 1))
+
     def find_all(self) -> List[Dict[str, Any]]:
         """Get all tags."""
         with self.db.get_connection() as conn:
@@ -395,14 +577,13 @@ class TagRepository:
         """Get most popular tags by post count."""
         with self.db.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute('''
-                SELECT t.*, COUNT(pt.post_id) as post_count
-                FROM tags t
-                LEFT JOIN post_tags pt ON t.id = pt.tag_id
-                GROUP BY t.id
-                ORDER BY post_count DESC
-                LIMIT ?
-            ''', (limit,))
+            # post_count is maintained by triggers on post_tags, so this
+            # reads the first rows of idx_tags_post_count instead of
+            # aggregating the junction table
+            cursor.execute(
+                'SELECT * FROM tags ORDER BY post_count DESC, id LIMIT ?',
+                (limit,)
+            )
             return [dict(row) for row in cursor.fetchall()]
 
 
@@ -410,12 +591,13 @@ def demo():
     """Demonstrate database operations."""
     import os
 
-    # Clean up old database
-    if os.path.exists('demo.db'):
-        os.remove('demo.db')
+    # Clean up old database (and any WAL side files)
+    for path in ('demo.db', 'demo.db-wal', 'demo.db-shm'):
+        if os.path.exists(path):
+            os.remove(path)
 
-    # Initialize database
-    db = Database('demo.db')
+    # Seed in memory, then write the result to disk in one pass
+    db = Database(':memory:')
     db.initialize()
 
     users_repo = UserRepository(db)
@@ -428,53 +610,44 @@ def demo():
 
     # Create users
     print("\n--- Creating Users ---")
-    alice_id = users_repo.create(
-        'alice',
-        'alice@example.com',
-        'hashed_password_1',
-        'Alice Johnson'
-    )
-    bob_id = users_repo.create(
-        'bob',
-        'bob@example.com',
-        'hashed_password_2',
-        'Bob Smith'
-    )
+    alice_id, bob_id = users_repo.create_many([
+        ('alice', 'alice@example.com', 'hashed_password_1', 'Alice Johnson'),
+        ('bob', 'bob@example.com', 'hashed_password_2', 'Bob Smith'),
+    ])
     print(f"Created users: Alice (ID: {alice_id}), Bob (ID: {bob_id})")
 
     # Create posts
     print("\n--- Creating Posts ---")
-    post1_id = posts_repo.create(
-        alice_id,
-        'First Post',
-        'This is my first post!',
-        'published'
-    )
-    post2_id = posts_repo.create(
-        alice_id,
-        'Second Post',
-        'Another great post',
-        'published'
-    )
-    post3_id = posts_repo.create(
-        bob_id,
-        'Bob\'s Post',
-        'Hello from Bob',
-        'draft'
-    )
+    post1_id, post2_id, post3_id = posts_repo.create_many([
+        (alice_id, 'First Post', 'This is my first post!', 'published'),
+        (alice_id, 'Second Post', 'Another great post', 'published'),
+        (bob_id, 'Bob\'s Post', 'Hello from Bob', 'draft'),
+    ])
     print(f"Created {3} posts")
 
     # Create tags
     print("\n--- Creating Tags ---")
-    python_tag = tags_repo.create('Python', 'python')
-    js_tag = tags_repo.create('JavaScript', 'javascript')
-    web_tag = tags_repo.create('Web Development', 'web-dev')
+    python_tag, js_tag, web_tag = tags_repo.create_many([
+        ('Python', 'python'),
+        ('JavaScript', 'javascript'),
+        ('Web Development', 'web-dev'),
+    ])
     print(f"Created {3} tags")
 
     # Add tags to posts
     posts_repo.add_tags(post1_id, [python_tag, web_tag])
     posts_repo.add_tags(post2_id, [js_tag, web_tag])
 
+    # Materialize the seeded database and query the on-disk copy
+    db.snapshot('demo.db')
+    db.close()
+
+    db = Database('demo.db')
+    db.initialize()
+    users_repo = UserRepository(db)
+    posts_repo = PostRepository(db)
+    tags_repo = TagRepository(db)
+
     # Query operations
     print("\n--- Querying Data ---")
 
@@ -489,10 +662,9 @@ def demo():
         print(f"  - {post['title']} by {post['username']}")
 
     # Get post with tags
-    post = posts_repo.find_by_id(post1_id)
-    tags = posts_repo.get_post_tags(post1_id)
+    post = posts_repo.find_with_tags(post1_id)
     print(f"\nPost: {post['title']}")
-    print(f"Tags: {', '.join(t['name'] for t in tags)}")
+    print(f"Tags: {', '.join(post['tags'])}")
 
     # Get user stats
     stats = users_repo.get_user_stats(alice_id)
@@ -5,8 +5,12 @@ Patterns that deal with object interaction and responsibility distribution.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Deque
 from enum import Enum
+from collections import defaultdict, deque
+from itertools import count
+import heapq
+import weakref
 
 
 # STRATEGY PATTERN
@@ -22,25 +26,29 @@ class PaymentStrategy(ABC):
 class CreditCardPayment(PaymentStrategy):
     def __init__(self, card_number: str):
         self.card_number = card_number
+        # Everything after the amount is fixed per instance
+        self._suffix = f" using credit card ending in {card_number[-4:]}"
 
     def pay(self, amount: float) -> str:
-        return f"Paid ${amount:.2f} using credit card ending in {self.card_number[-4:]}"
+        return f"Paid ${amount:.2f}{self._suffix}"
 
 
 class PayPalPayment(PaymentStrategy):
     def __init__(self, email: str):
         self.email = email
+        self._suffix = f" using PayPal ({email})"
 
     def pay(self, amount: float) -> str:
-        return f"Paid ${amount:.2f} using PayPal ({self.email})"
+        return f"Paid ${amount:.2f}{self._suffix}"
 
 
 class CryptoPayment(PaymentStrategy):
     def __init__(self, wallet_address: str):
         self.wallet_address = wallet_address
+        self._suffix = f" using crypto wallet {wallet_address[:10]}..."
 
     def pay(self, amount: float) -> str:
-        return f"Paid ${amount:.2f} using crypto wallet {self.wallet_address[:10]}..."
+        return f"Paid ${amount:.2f}{self._suffix}"
 
 
 class ShoppingCart:
@@ -82,18 +90,62 @@ class Subject:
     """Subject being observed."""
 
     def __init__(self):
-        self._observers: List[Observer] = []
+        # Topic of each observer, keyed by id(), plus per-topic buckets of
+        # (attach sequence number, observer, weak) entries. An entry holds
+        # the observer itself, or a weak reference for attach(weak=True).
+        self._observers: Dict[int, str] = {}
+        self._topics: Dict[str, Dict[int, Tuple[int, Any, bool]]] = defaultdict(dict)
+        self._sequence = count()
         self._state = None
 
-    def attach(self, observer: Observer):
-        self._observers.append(observer)
+    def attach(self, observer: Observer, topic: str = '*', weak: bool = False):
+        """
+        Subscribe observer to topic ('*' receives every notification).
+
+        With weak=True the subject does not keep the observer alive: once
+        nothing else references it, it drops out without a detach().
+        """
+        key = id(observer)
+        self._forget(key)
+        target = observer
+        if weak:
+            # The callback holds the subject weakly too, so subject and
+            # reference do not keep each other alive
+            subject = weakref.ref(self)
+
+            def forget(_, key=key):
+                owner = subject()
+                if owner is not None:
+                    owner._forget(key)
+
+            target = weakref.ref(observer, forget)
+        self._observers[key] = topic
+        self._topics[topic][key] = (next(self._sequence), target, weak)
 
     def detach(self, observer: Observer):
-        self._observers.remove(observer)
-
-    def notify(self, message: str):
-        for observer in self._observers:
-            observer.update(message)
+        self._forget(id(observer))
+
+    def _forget(self, key: int):
+        topic = self._observers.pop(key, None)
+        if topic is not None:
+            del self._topics[topic][key]
+
+    def notify(self, message: str, topic: Optional[str] = None):
+        """
+        Notify the observers of topic and of '*', in attach order.
+
+        Without a topic (or with '*') only '*' observers are notified;
+        observers of a specific topic only hear about that topic.
+        """
+        entries = list(self._topics.get('*', {}).values())
+        if topic is not None and topic != '*':
+            # Each bucket is already in attach order; merge them by sequence
+            entries = list(heapq.merge(self._topics.get(topic, {}).values(), entries))
+
+        for _, target, weak in entries:
+            observer = target() if weak else target
+            if observer is not None:
+                observer.update(message)
 
     def set_state(self, state: Any):
         self._state = state
@@ -118,6 +170,8 @@ class ConcreteObserver(Observer):
 class Command(ABC):
     """Command interface."""
 
+    __slots__ = ()
+
     @abstractmethod
     def execute(self):
         pass
@@ -145,6 +199,8 @@ class Light:
 class LightOnCommand(Command):
     """Concrete command."""
 
+    __slots__ = ("light",)
+
     def __init__(self, light: Light):
         self.light = light
 
@@ -156,6 +212,8 @@ class LightOnCommand(Command):
 
 
 class LightOffCommand(Command):
+    __slots__ = ("light",)
+
     def __init__(self, light: Light):
         self.light = light
 
@@ -172,13 +230,18 @@ class RemoteControl:
     Allows parameterization, queuing, logging, and undo operations.
     """
 
-    def __init__(self):
-        self.history: List[Command] = []
+    def __init__(self, max_undo: int = 64):
+        # Bounded: the oldest command is dropped once max_undo are kept
+        self.history: Deque[Command] = deque(maxlen=max_undo)
 
     def execute_command(self, command: Command):
         command.execute()
         self.history.append(command)
 
+    def execute_command_no_undo(self, command: Command):
+        """Execute without recording the command for undo_last()."""
+        command.execute()
+
     def undo_last(self):
         if self.history:
             command = self.history.pop()
@@ -199,14 +262,14 @@ class DraftState(State):
     def handle(self, context: 'DocumentContext'):
         print("Document is in DRAFT state")
         print("Available actions: edit, submit for review")
-        context.state = ReviewState()
+        context.state = REVIEW
 
 
 class ReviewState(State):
     def handle(self, context: 'DocumentContext'):
         print("Document is in REVIEW state")
         print("Available actions: approve, reject")
-        context.state = PublishedState()
+        context.state = PUBLISHED
 
 
 class PublishedState(State):
@@ -215,6 +278,13 @@ class PublishedState(State):
         print("Available actions: archive")
 
 
+# States carry no per-document data, so one shared instance of each is
+# enough and transitions only reassign a reference
+DRAFT = DraftState()
+REVIEW = ReviewState()
+PUBLISHED = PublishedState()
+
+
 class DocumentContext:
     """
     State Pattern: Alters behavior when internal state changes.
@@ -222,7 +292,7 @@ class DocumentContext:
     """
 
     def __init__(self):
-        self.state: State = DraftState()
+        self.state: State = DRAFT
 
     def request(self):
         self.state.handle(self)
@@ -296,6 +366,9 @@ class Iterator(ABC):
         pass
 
 
+_EXHAUSTED = object()
+
+
 class BookCollection:
     """Aggregate."""
 
@@ -308,6 +381,9 @@ class BookCollection:
     def create_iterator(self) -> Iterator:
         return BookIterator(self)
 
+    def __iter__(self):
+        return iter(self.books)
+
 
 class BookIterator(Iterator):
     """
@@ -317,17 +393,33 @@ class BookIterator(Iterator):
 
     def __init__(self, collection: BookCollection):
         self.collection = collection
-        self.index = 0
+        self._position = 0  # Books returned so far
+        # Backed by the list's C iterator; the next book is only fetched
+        # when asked for, so books added after creation are still seen
+        self._books = iter(collection.books)
+        self._peek = _EXHAUSTED
+
+    def _fetch(self):
+        """Hold the next book in _peek, or _EXHAUSTED if there is none."""
+        if self._peek is _EXHAUSTED:
+            self._peek = next(self._books, _EXHAUSTED)
+            if self._peek is _EXHAUSTED and self._position < len(self.collection.books):
+                # An exhausted list iterator never resumes; continue over
+                # the books added since it ran out
+                self._books = iter(self.collection.books[self._position:])
+                self._peek = next(self._books)
+        return self._peek
 
     def has_next(self) -> bool:
-        return self.index < len(self.collection.books)
+        return self._fetch() is not _EXHAUSTED
 
     def next(self) -> str:
-        if self.has_next():
-            book = self.collection.books[self.index]
-            self.index += 1
-            return book
-        raise StopIteration
+        book = self._fetch()
+        if book is _EXHAUSTED:
+            raise StopIteration
+        self._peek = _EXHAUSTED
+        self._position += 1
+        return book
 
 
 # CHAIN OF RESPONSIBILITY PATTERN
@@ -429,11 +521,16 @@ class User:
 class EditorMemento:
     """Memento: Stores state."""
 
-    def __init__(self, content: str):
-        self._content = content
+    def __init__(self, chunks: Tuple[str, ...]):
+        # The written chunks rather than their concatenation; snapshots
+        # share the chunk strings instead of each copying the full text
+        self._chunks = tuple(chunks)
+
+    def get_chunks(self) -> Tuple[str, ...]:
+        return self._chunks
 
     def get_content(self) -> str:
-        return self._content
+        return "".join(self._chunks)
 
 
 class TextEditor:
@@ -443,18 +540,33 @@ class TextEditor:
     """
 
     def __init__(self):
-        self.content = ""
+        # Writes append chunks; content joins them on demand and caches it
+        self._chunks: List[str] = []
+        self._content: Optional[str] = ""
+
+    @property
+    def content(self) -> str:
+        if self._content is None:
+            self._content = "".join(self._chunks)
+        return self._content
+
+    @content.setter
+    def content(self, text: str):
+        self._chunks = [text]
+        self._content = text
 
     def write(self, text: str):
-        self.content += text
+        self._chunks.append(text)
+        self._content = None
 
     def save(self) -> EditorMemento:
         """Create memento."""
-        return EditorMemento(self.content)
+        return EditorMemento(self._chunks)
 
     def restore(self, memento: EditorMemento):
         """Restore from memento."""
-        self.content = memento.get_content()
+        self._chunks = list(memento.get_chunks())
+        self._content = None
 
     def __str__(self):
         return f"Content: {self.content}"
@@ -4,9 +4,11 @@ Creational Design Patterns
 Patterns that deal with object creation mechanisms.
 """
 
-from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import Dict, Any, Optional
+from collections import deque
 import copy
+import threading
 
 
 # SINGLETON PATTERN
@@ -14,14 +16,22 @@ import copy
 class SingletonMeta(type):
     """
     Metaclass for Singleton pattern.
-    Thread-safe singleton implementation.
+    Thread-safe singleton implementation using double-checked locking:
+    once created, the instance is cached on the class itself so later
+    calls are a single attribute lookup.
     """
-    _instances = {}
+    _lock = threading.Lock()
 
     def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            cls._instances[cls] = super().__call__(*args, **kwargs)
-        return cls._instances[cls]
+        instance = cls.__dict__.get('_instance')
+        if instance is not None:
+            return instance
+        with cls._lock:
+            instance = cls.__dict__.get('_instance')
+            if instance is None:
+                instance = super().__call__(*args, **kwargs)
+                cls._instance = instance
+        return instance
 
 
 class DatabaseConnection(metaclass=SingletonMeta):
@@ -30,30 +40,33 @@ class DatabaseConnection(metaclass=SingletonMeta):
     Ensures only one connection instance exists.
     """
 
+    __slots__ = ('connection_string', 'connected')
+
     def __init__(self):
-        self.connection_string = None
-        self.connected = False
+        self.connection_string: Optional[str] = None
+        self.connected: bool = False
 
     def connect(self, connection_string: str):
-        if not self.connected:
-            self.connection_string = connection_string
-            self.connected = True
-            print(f"Connected to: {connection_string}")
+        if self.connected:
+            return
+        self.connection_string = connection_string
+        self.connected = True
+        print(f"Connected to: {connection_string}")
 
     def disconnect(self):
-        if self.connected:
-            self.connected = False
-            print("Disconnected")
+        if not self.connected:
+            return
+        self.connected = False
+        print("Disconnected")
 
 
 # FACTORY PATTERN
 
-class Animal(ABC):
+class Animal:
     """Abstract product."""
 
-    @abstractmethod
     def speak(self) -> str:
-        pass
+        raise NotImplementedError
 
 
 class Dog(Animal):
@@ -71,6 +84,13 @@ class Bird(Animal):
         return "Tweet!"
 
 
+_ANIMALS: Dict[str, type] = {
+    'dog': Dog,
+    'cat': Cat,
+    'bird': Bird
+}
+
+
 class AnimalFactory:
     """
     Factory Pattern: Creates objects without specifying exact class.
@@ -78,13 +98,7 @@ class AnimalFactory:
 
     @staticmethod
     def create_animal(animal_type: str) -> Animal:
-        animals = {
-            'dog': Dog,
-            'cat': Cat,
-            'bird': Bird
-        }
-
-        animal_class = animals.get(animal_type.lower())
+        animal_class = _ANIMALS.get(animal_type.lower())
         if not animal_class:
             raise ValueError(f"Unknown animal type: {animal_type}")
 
@@ -93,16 +107,14 @@ class AnimalFactory:
 
 # ABSTRACT FACTORY PATTERN
 
-class Button(ABC):
-    @abstractmethod
+class Button:
     def render(self) -> str:
-        pass
+        raise NotImplementedError
 
 
-class Checkbox(ABC):
-    @abstractmethod
+class Checkbox:
     def render(self) -> str:
-        pass
+        raise NotImplementedError
 
 
 class WindowsButton(Button):
@@ -125,16 +137,14 @@ class MacCheckbox(Checkbox):
         return "Rendering Mac checkbox"
 
 
-class GUIFactory(ABC):
+class GUIFactory:
     """Abstract Factory for creating families of related objects."""
 
-    @abstractmethod
     def create_button(self) -> Button:
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def create_checkbox(self) -> Checkbox:
-        pass
+        raise NotImplementedError
 
 
 class WindowsFactory(GUIFactory):
@@ -155,15 +165,15 @@ class MacFactory(GUIFactory):
 
 # BUILDER PATTERN
 
+@dataclass(frozen=True, slots=True)
 class Computer:
     """Complex object to be built."""
 
-    def __init__(self):
-        self.cpu = None
-        self.ram = None
-        self.storage = None
-        self.gpu = None
-        self.os = None
+    cpu: Optional[str] = None
+    ram: Optional[str] = None
+    storage: Optional[str] = None
+    gpu: Optional[str] = None
+    os: Optional[str] = None
 
     def __str__(self):
         return (f"Computer(CPU: {self.cpu}, RAM: {self.ram}, "
@@ -174,33 +184,36 @@ class ComputerBuilder:
     """
     Builder Pattern: Constructs complex objects step by step.
     Allows different representations using same construction process.
+
+    Parts are collected in a dict and the immutable Computer is created
+    in a single keyword construction when build() is called.
     """
 
     def __init__(self):
-        self.computer = Computer()
+        self._parts: Dict[str, str] = {}
 
     def set_cpu(self, cpu: str) -> 'ComputerBuilder':
-        self.computer.cpu = cpu
+        self._parts['cpu'] = cpu
         return self
 
     def set_ram(self, ram: str) -> 'ComputerBuilder':
-        self.computer.ram = ram
+        self._parts['ram'] = ram
         return self
 
     def set_storage(self, storage: str) -> 'ComputerBuilder':
-        self.computer.storage = storage
+        self._parts['storage'] = storage
         return self
 
     def set_gpu(self, gpu: str) -> 'ComputerBuilder':
-        self.computer.gpu = gpu
+        self._parts['gpu'] = gpu
         return self
 
     def set_os(self, os: str) -> 'ComputerBuilder':
-        self.computer.os = os
+        self._parts['os'] = os
         return self
 
     def build(self) -> Computer:
-        return self.computer
+        return Computer(**self._parts)
 
 
 class ComputerDirector:
@@ -229,12 +242,13 @@ class ComputerDirector:
 
 # PROTOTYPE PATTERN
 
-class Prototype(ABC):
+class Prototype:
     """Prototype interface."""
 
-    @abstractmethod
+    __slots__ = ()
+
     def clone(self):
-        pass
+        raise NotImplementedError
 
 
 class Document(Prototype):
@@ -243,18 +257,24 @@ class Document(Prototype):
     Useful when object creation is expensive.
     """
 
+    __slots__ = ('title', 'content', 'metadata')
+
     def __init__(self, title: str, content: str, metadata: Dict[str, Any]):
         self.title = title
         self.content = content
         self.metadata = metadata
 
     def clone(self) -> 'Document':
-        """Shallow copy."""
-        return copy.copy(self)
+        """Shallow copy (metadata dict is shared)."""
+        return self.__class__(self.title, self.content, self.metadata)
 
     def deep_clone(self) -> 'Document':
-        """Deep copy."""
-        return copy.deepcopy(self)
+        """
+        Deep copy.
+        title and content are immutable strings, so only metadata needs
+        copying; this avoids deepcopy's memo walk over the whole object.
+        """
+        return self.__class__(self.title, self.content, copy.deepcopy(self.metadata))
 
     def __str__(self):
         return f"Document(title='{self.title}', content='{self.content[:20]}...', metadata={self.metadata})"
@@ -262,20 +282,28 @@ class Document(Prototype):
 
 # OBJECT POOL PATTERN
 
+# Per-object trace output; off by default so acquire/release stay cheap
+POOL_DEBUG = False
+
+
 class Reusable:
     """Reusable object."""
 
+    __slots__ = ('id', 'in_use')
+
     def __init__(self, id: int):
         self.id = id
         self.in_use = False
 
     def use(self):
         self.in_use = True
-        print(f"Object {self.id} is now in use")
+        if POOL_DEBUG:
+            print(f"Object {self.id} is now in use")
 
     def release(self):
         self.in_use = False
-        print(f"Object {self.id} is released")
+        if POOL_DEBUG:
+            print(f"Object {self.id} is released")
 
 
 class ObjectPool:
@@ -286,18 +314,21 @@ class ObjectPool:
 
     def __init__(self, size: int):
         self.pool = [Reusable(i) for i in range(size)]
+        self._free = deque(self.pool)
 
     def acquire(self) -> Optional[Reusable]:
-        """Get available object from pool."""
-        for obj in self.pool:
-            if not obj.in_use:
-                obj.use()
-                return obj
-        return None
+        """Get available object from pool in O(1) via the free list."""
+        if not self._free:
+            return None
+        obj = self._free.popleft()
+        obj.use()
+        return obj
 
     def release(self, obj: Reusable):
         """Return object to pool."""
-        obj.release()
+        if obj.in_use:
+            obj.release()
+            self._free.append(obj)
 
 
 def demo():
@@ -370,10 +401,12 @@ def demo():
     obj3 = pool.acquire()
     obj4 = pool.acquire()  # Should be None (pool exhausted)
 
+    print(f"Objects in use: {[obj.id for obj in (obj1, obj2, obj3)]}")
     print(f"Object 4 acquired: {obj4 is not None}")
 
     pool.release(obj1)
     obj4 = pool.acquire()  # Should succeed now
+    print(f"Released object {obj1.id}, re-acquired object {obj4.id}")
     print(f"Object 4 acquired after release: {obj4 is not None}")
 
 
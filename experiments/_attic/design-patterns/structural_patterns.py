@@ -5,7 +5,8 @@ Patterns that deal with object composition and relationships.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple, Optional
+from functools import lru_cache
 
 
 # ADAPTER PATTERN
@@ -160,27 +161,97 @@ class Directory(FileSystemComponent):
     def __init__(self, name: str):
         self.name = name
         self.children: List[FileSystemComponent] = []
+        self._cached_size: Optional[int] = None
+        self._parent: Optional[Directory] = None
 
     def add(self, component: FileSystemComponent):
+        if isinstance(component, Directory):
+            # One parent per directory, so invalidation can follow _parent
+            if component._parent is not None and component._parent is not self:
+                raise ValueError(f"Directory {component.name!r} already belongs "
+                                 f"to {component._parent.name!r}")
+            component._parent = self
         self.children.append(component)
+        self._invalidate()
 
     def remove(self, component: FileSystemComponent):
         self.children.remove(component)
+        if isinstance(component, Directory) and component not in self.children:
+            component._parent = None
+        self._invalidate()
+
+    def _invalidate(self):
+        """Drop the cached size here and in every ancestor."""
+        node = self
+        while node is not None and node._cached_size is not None:
+            node._cached_size = None
+            node = node._parent
 
     def get_size(self) -> int:
-        return sum(child.get_size() for child in self.children)
+        """
+        Total size of the subtree, memoized until the next add/remove.
+
+        Changing a File's size in place is not tracked; call add/remove
+        (or flatten() + subtree_sizes() for bulk recomputation) instead.
+        """
+        if self._cached_size is None:
+            self._cached_size = sum(child.get_size() for child in self.children)
+        return self._cached_size
 
     def display(self, indent: int = 0):
         print("  " * indent + f"+ {self.name}/")
         for child in self.children:
             child.display(indent + 1)
 
+    def flatten(self) -> Tuple[List[FileSystemComponent], List[int], List[int]]:
+        """
+        Flatten the subtree into parallel arrays in pre-order.
+
+        Returns (nodes, sizes, parent): sizes[i] is the leaf size of
+        nodes[i] (0 for directories) and parent[i] the index of its
+        directory (-1 for self). Parents always precede their children.
+        """
+        nodes: List[FileSystemComponent] = []
+        sizes: List[int] = []
+        parent: List[int] = []
+        stack = [(self, -1)]
+
+        while stack:
+            node, parent_index = stack.pop()
+            index = len(nodes)
+            nodes.append(node)
+            parent.append(parent_index)
+
+            if isinstance(node, Directory):
+                sizes.append(0)
+                stack.extend((child, index) for child in reversed(node.children))
+            else:
+                sizes.append(node.get_size())
+
+        return nodes, sizes, parent
+
+
+def subtree_sizes(sizes: List[int], parent: List[int]) -> List[int]:
+    """
+    Total size of every node's subtree from Directory.flatten() arrays.
+
+    One backwards pass (children before parents) adds each total into its
+    parent, so every directory's size costs O(N) overall instead of one
+    recursive get_size() walk per directory.
+    """
+    totals = list(sizes)
+    for i in range(len(totals) - 1, 0, -1):
+        totals[parent[i]] += totals[i]
+    return totals
+
 
 # DECORATOR PATTERN
 
 class Coffee(ABC):
     """Component interface."""
 
+    __slots__ = ()
+
     @abstractmethod
     def get_cost(self) -> float:
         pass
@@ -204,40 +275,49 @@ class CoffeeDecorator(Coffee):
     """
     Decorator Pattern: Adds responsibilities to objects dynamically.
     Alternative to subclassing for extending functionality.
+
+    Subclasses set _delta_cost and _suffix. A decorated coffee never
+    changes, so cost and description are computed down the chain once and
+    cached on the instance.
     """
 
+    __slots__ = ('_coffee', '_cost', '_description')
+
+    _delta_cost = 0.0
+    _suffix = ""
+
     def __init__(self, coffee: Coffee):
         self._coffee = coffee
+        self._cost = None
+        self._description = None
 
     def get_cost(self) -> float:
-        return self._coffee.get_cost()
+        if self._cost is None:
+            self._cost = self._coffee.get_cost() + self._delta_cost
+        return self._cost
 
     def get_description(self) -> str:
-        return self._coffee.get_description()
+        if self._description is None:
+            self._description = self._coffee.get_description() + self._suffix
+        return self._description
 
 
 class MilkDecorator(CoffeeDecorator):
-    def get_cost(self) -> float:
-        return self._coffee.get_cost() + 0.5
-
-    def get_description(self) -> str:
-        return self._coffee.get_description() + ", milk"
+    __slots__ = ()
+    _delta_cost = 0.5
+    _suffix = ", milk"
 
 
 class SugarDecorator(CoffeeDecorator):
-    def get_cost(self) -> float:
-        return self._coffee.get_cost() + 0.2
-
-    def get_description(self) -> str:
-        return self._coffee.get_description() + ", sugar"
+    __slots__ = ()
+    _delta_cost = 0.2
+    _suffix = ", sugar"
 
 
 class VanillaDecorator(CoffeeDecorator):
-    def get_cost(self) -> float:
-        return self._coffee.get_cost() + 0.7
-
-    def get_description(self) -> str:
-        return self._coffee.get_description() + ", vanilla"
+    __slots__ = ()
+    _delta_cost = 0.7
+    _suffix = ", vanilla"
 
 
 # FACADE PATTERN
@@ -307,21 +387,23 @@ class CharacterFactory:
     Separates intrinsic (shared) from extrinsic (unique) state.
     """
 
-    _flyweights: Dict[tuple, CharacterFlyweight] = {}
-
-    @classmethod
-    def get_character(cls, char: str, font: str, size: int) -> CharacterFlyweight:
-        key = (char, font, size)
-
-        if key not in cls._flyweights:
-            cls._flyweights[key] = CharacterFlyweight(char, font, size)
-            print(f"Creating new flyweight for '{char}'")
+    @staticmethod
+    def get_character(char: str, font: str, size: int) -> CharacterFlyweight:
+        # Always forward positionally: lru_cache keys keyword calls
+        # separately, which would hand out a second flyweight for one state
+        return CharacterFactory._get_character(char, font, size)
 
-        return cls._flyweights[key]
+    # The flyweight pool is the lru_cache itself: a hit is a single lookup
+    # in C, and the body only runs to create a missing flyweight
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _get_character(char: str, font: str, size: int) -> CharacterFlyweight:
+        print(f"Creating new flyweight for '{char}'")
+        return CharacterFlyweight(char, font, size)
 
     @classmethod
     def get_flyweight_count(cls) -> int:
-        return len(cls._flyweights)
+        return cls._get_character.cache_info().currsize
 
 
 # PROXY PATTERN
@@ -0,0 +1,64 @@
+"""
+Tests for the behavioral design patterns.
+"""
+
+import pytest
+from behavioral_patterns import Subject
+
+
+class Recorder:
+    """Observer that appends (name, message) to a shared log."""
+
+    def __init__(self, name, log):
+        self.name = name
+        self.log = log
+
+    def update(self, message):
+        self.log.append((self.name, message))
+
+
+class TestObserver:
+    """Test suite for Subject topic filtering and delivery order."""
+
+    @pytest.fixture
+    def subject(self):
+        """Attach price, *, price and stock observers, in that order."""
+        log = []
+        subject = Subject()
+        observers = {name: Recorder(name, log) for name in 'abcd'}
+        subject.attach(observers['a'], topic='price')
+        subject.attach(observers['b'])
+        subject.attach(observers['c'], topic='price')
+        subject.attach(observers['d'], topic='stock')
+        return subject, observers, log
+
+    def test_topic_delivers_in_attach_order(self, subject):
+        """Test topic and '*' observers are interleaved by attach order."""
+        subject, _, log = subject
+
+        subject.notify('p', topic='price')
+
+        assert [name for name, _ in log] == ['a', 'b', 'c']
+
+    def test_no_topic_reaches_wildcard_only(self, subject):
+        """Test an untargeted notify skips topic-specific observers."""
+        subject, _, log = subject
+
+        subject.notify('n')
+        subject.notify('w', topic='*')
+
+        assert log == [('b', 'n'), ('b', 'w')]
+
+    def test_reattach_moves_to_end(self, subject):
+        """Test re-attaching an observer moves it to the end of the order."""
+        subject, observers, log = subject
+
+        subject.attach(observers['a'], topic='price')
+        subject.detach(observers['b'])
+        subject.notify('p', topic='price')
+
+        assert [name for name, _ in log] == ['c', 'a']
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,119 @@
+"""
+Tests for the structural design patterns.
+"""
+
+import pytest
+from structural_patterns import CharacterFactory, Directory, File, subtree_sizes
+
+
+class TestComposite:
+    """Test suite for the Directory/File composite."""
+
+    @pytest.fixture
+    def tree(self):
+        """Build root/{a.txt, docs/{b.txt, deep/{c.txt}}}."""
+        root = Directory('root')
+        docs = Directory('docs')
+        deep = Directory('deep')
+        root.add(File('a.txt', 1))
+        root.add(docs)
+        docs.add(File('b.txt', 10))
+        docs.add(deep)
+        deep.add(File('c.txt', 100))
+        return root, docs, deep
+
+    def test_get_size(self, tree):
+        """Test subtree sizes are summed."""
+        root, docs, deep = tree
+
+        assert root.get_size() == 111
+        assert docs.get_size() == 110
+        assert deep.get_size() == 100
+
+    def test_repeated_get_size_after_add_and_remove(self, tree):
+        """Test cached sizes are refreshed up the tree after every change."""
+        root, docs, deep = tree
+        assert root.get_size() == 111
+        assert root.get_size() == 111
+
+        extra = File('d.txt', 1000)
+        deep.add(extra)
+        assert root.get_size() == 1111
+        assert docs.get_size() == 1110
+        assert root.get_size() == 1111
+
+        deep.remove(extra)
+        assert root.get_size() == 111
+        assert deep.get_size() == 100
+
+        root.remove(docs)
+        assert root.get_size() == 1
+        deep.add(File('e.txt', 5))
+        assert root.get_size() == 1
+        assert docs.get_size() == 115
+
+    def test_subtree_added_after_sizes_were_cached(self, tree):
+        """Test attaching a cached subtree invalidates the new ancestors."""
+        root, docs, deep = tree
+        other = Directory('other')
+        other.add(File('f.txt', 7))
+        assert other.get_size() == 7
+        assert root.get_size() == 111
+
+        deep.add(other)
+        assert root.get_size() == 118
+
+        other.add(File('g.txt', 3))
+        assert root.get_size() == 121
+
+    def test_directory_has_one_parent(self, tree):
+        """Test a directory cannot be added under a second parent."""
+        root, docs, deep = tree
+        other = Directory('other')
+
+        with pytest.raises(ValueError, match="already belongs"):
+            other.add(deep)
+
+        docs.remove(deep)
+        other.add(deep)
+        deep.add(File('h.txt', 100))
+        assert other.get_size() == 200
+        assert root.get_size() == 11
+
+    def test_flatten_matches_get_size(self, tree):
+        """Test the flat arrays give the same subtree sizes."""
+        root, _, _ = tree
+
+        nodes, sizes, parent = root.flatten()
+        totals = subtree_sizes(sizes, parent)
+
+        assert totals == [node.get_size() for node in nodes]
+
+
+class TestFlyweight:
+    """Test suite for the CharacterFactory flyweight pool."""
+
+    def test_same_state_shares_one_flyweight(self):
+        """Test equal intrinsic state returns the identical object."""
+        count = CharacterFactory.get_flyweight_count()
+
+        first = CharacterFactory.get_character('q', 'Arial', 12)
+        second = CharacterFactory.get_character('q', 'Arial', 12)
+
+        assert first is second
+        assert CharacterFactory.get_flyweight_count() == count + 1
+
+    def test_keyword_calls_share_the_flyweight(self):
+        """Test keyword and positional calls return the same object."""
+        first = CharacterFactory.get_character('w', 'Arial', 12)
+        count = CharacterFactory.get_flyweight_count()
+
+        second = CharacterFactory.get_character(char='w', font='Arial', size=12)
+        third = CharacterFactory.get_character('w', size=12, font='Arial')
+
+        assert first is second is third
+        assert CharacterFactory.get_flyweight_count() == count
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -15,101 +15,277 @@ import sys
 import json
 import os
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Callable, Iterator, List, Dict, Optional, Tuple
 import re
 import hashlib
-import base64
-
-
-class DevTools:
-    """Main class for developer utilities."""
-
-    def __init__(self):
-        self.parser = self._create_parser()
-
-    def _create_parser(self) -> argparse.ArgumentParser:
-        """Create the argument parser with all subcommands."""
-        parser = argparse.ArgumentParser(
-            description='DevTools - Developer Utilities CLI',
-            formatter_class=argparse.RawDescriptionHelpFormatter,
-            epilog='''
+import binascii
+import fnmatch
+import mmap
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import islice
+
+READ_CHUNK_SIZE = 1 << 20  # 1 MiB
+JSON_WRITE_BATCH = 8192  # iterencode chunks joined per write
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+# File walking is I/O bound and read()/stat() release the GIL
+IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Hash constructors resolved once. MD5/SHA1 are only used as checksums here,
+# so flag them as not security-relevant; FIPS-restricted builds otherwise
+# refuse them.
+_HASH_CTORS: Dict[str, Callable] = {
+    'md5': partial(hashlib.md5, usedforsecurity=False),
+    'sha1': partial(hashlib.sha1, usedforsecurity=False),
+    'sha256': hashlib.sha256,
+    'sha512': hashlib.sha512,
+}
+
+# Regex constructs whose result depends on what follows a line's newline
+# (\A, \Z, $, \b, \B, lookaround); patterns using them are searched line
+# by line
+_LINE_CONTEXT = re.compile(r'\\[AZbB]|\$|\(\?[=!<]')
+# Bytes where a bytes regex over the raw file and a str regex over the
+# decoded lines disagree: CR (text mode turns CRLF into LF), the \x1c-\x1f
+# separators (str \s matches them) and non-ASCII (case folding, \w, \d)
+_NOT_PLAIN_ASCII = re.compile(rb'[\r\x1c-\x1f\x80-\xff]')
+
+# JSON codecs are stateless, so build them once and reuse across calls
+_JSON_DECODER = json.JSONDecoder()
+_JSON_MINIFY_ENCODER = json.JSONEncoder(separators=(',', ':'))
+
+
+@lru_cache(maxsize=None)
+def _json_format_encoder(indent: int) -> json.JSONEncoder:
+    """Return a shared pretty-printing encoder for the given indent."""
+    return json.JSONEncoder(indent=indent, sort_keys=True)
+
+
+def _new_hasher(algo: str, data: bytes = b''):
+    """Create a hash object for algo from the constructor table."""
+    return _HASH_CTORS[algo](data)
+
+
+def _hash_file(f, algo: str):
+    """
+    Hash an open binary file without loading it into memory.
+    hashlib.file_digest (3.11+) feeds OpenSSL directly with the GIL
+    released, which keeps SHA-NI/ARMv8 SHA accelerated paths busy.
+    """
+    if hasattr(hashlib, 'file_digest'):
+        return hashlib.file_digest(f, lambda: _new_hasher(algo))
+    hasher = _new_hasher(algo)
+    while chunk := f.read(READ_CHUNK_SIZE):
+        hasher.update(chunk)
+    return hasher
+
+
+def _count_lines(path) -> int:
+    """Count lines by scanning binary chunks for newlines (no per-line objects)."""
+    lines = 0
+    last = b'\n'
+    with open(path, 'rb') as f:
+        while chunk := f.read(READ_CHUNK_SIZE):
+            lines += chunk.count(b'\n')
+            last = chunk[-1:]
+    # A final line without a trailing newline still counts as a line
+    if last != b'\n':
+        lines += 1
+    return lines
+
+
+def _try_count_lines(path):
+    """Worker for the thread pool: return (lines, error) instead of raising."""
+    try:
+        return _count_lines(path), None
+    except Exception as e:
+        return 0, e
+
+
+def _walk(root: str, pattern: str = '*', recursive: bool = False) -> Iterator[Tuple[str, os.DirEntry]]:
+    """
+    Yield (path, entry) for entries under root whose name matches pattern.
+
+    Uses os.scandir, whose DirEntry objects carry the file type from the
+    directory read, so is_file()/is_dir() need no extra stat() call.
+    Paths are spelled like Path(root).glob() would ('a.txt' for root '.').
+    Like rglob, symlinked directories are not descended into.
+    """
+    if '/' in pattern or os.sep in pattern:
+        # Multi-component patterns are rare; let pathlib handle them
+        matches = Path(root).rglob(pattern) if recursive else Path(root).glob(pattern)
+        for p in matches:
+            yield str(p), p
+        return
+
+    stack = [(root, '' if root == '.' else os.path.join(root, ''))]
+    while stack:
+        directory, prefix = stack.pop()
+        try:
+            it = os.scandir(directory)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                path = prefix + entry.name
+                if fnmatch.fnmatchcase(entry.name, pattern):
+                    yield path, entry
+                if recursive and entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, path + os.sep))
+
+
+def _entry_size(entry) -> int:
+    """Worker for the thread pool: size of a walked file entry."""
+    return entry.stat().st_size
+
+
+def _write_json(encoder: json.JSONEncoder, data, stream):
+    """
+    Write encoded JSON to stream.
+    Without indent, encode() runs the C encoder, so the one-shot string is
+    kept. With indent both paths run the pure-Python encoder, so the chunks
+    are streamed in joined batches (one write per chunk is slow on stdout)
+    and the document is never held in memory whole.
+    """
+    if encoder.indent is None:
+        stream.write(encoder.encode(data))
+        return
+    chunks = encoder.iterencode(data)
+    write = stream.write
+    for batch in iter(lambda: ''.join(islice(chunks, JSON_WRITE_BATCH)), ''):
+        write(batch)
+
+
+@lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    Create the argument parser with all subcommands.
+    Built on first use and cached, since the command tree never changes.
+    """
+    parser = argparse.ArgumentParser(
+        description='DevTools - Developer Utilities CLI',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='''
 Examples:
   devtools.py json format input.json
   devtools.py file count *.py
   devtools.py text encode "Hello World"
   devtools.py hash md5 myfile.txt
-            '''
-        )
+        '''
+    )
 
-        parser.add_argument('-v', '--version', action='version', version='DevTools 1.0.0')
+    parser.add_argument('-v', '--version', action='version', version='DevTools 1.0.0')
 
-        subparsers = parser.add_subparsers(dest='command', help='Available commands')
+    subparsers = parser.add_subparsers(dest='command', help='Available commands')
 
-        # JSON command
-        json_parser = subparsers.add_parser('json', help='JSON operations')
-        json_subparsers = json_parser.add_subparsers(dest='json_action')
+    # JSON command
+    json_parser = subparsers.add_parser('json', help='JSON operations')
+    json_subparsers = json_parser.add_subparsers(dest='json_action')
 
-        json_format = json_subparsers.add_parser('format', help='Format JSON file')
-        json_format.add_argument('file', help='JSON file to format')
-        json_format.add_argument('-i', '--indent', type=int, default=2, help='Indentation level')
-        json_format.add_argument('-o', '--output', help='Output file (default: overwrite)')
+    json_format = json_subparsers.add_parser('format', help='Format JSON file')
+    json_format.add_argument('file', help='JSON file to format')
+    json_format.add_argument('-i', '--indent', type=int, default=2, help='Indentation level')
+    json_format.add_argument('-o', '--output', help='Output file (default: overwrite)')
 
-        json_validate = json_subparsers.add_parser('validate', help='Validate JSON file')
-        json_validate.add_argument('file', help='JSON file to validate')
+    json_validate = json_subparsers.add_parser('validate', help='Validate JSON file')
+    json_validate.add_argument('file', help='JSON file to validate')
 
-        json_minify = json_subparsers.add_parser('minify', help='Minify JSON file')
-        json_minify.add_argument('file', help='JSON file to minify')
-        json_minify.add_argument('-o', '--output', help='Output file')
+    json_minify = json_subparsers.add_parser('minify', help='Minify JSON file')
+    json_minify.add_argument('file', help='JSON file to minify')
+    json_minify.add_argument('-o', '--output', help='Output file')
 
-        # File command
-        file_parser = subparsers.add_parser('file', help='File operations')
-        file_subparsers = file_parser.add_subparsers(dest='file_action')
+    # File command
+    file_parser = subparsers.add_parser('file', help='File operations')
+    file_subparsers = file_parser.add_subparsers(dest='file_action')
 
-        file_count = file_subparsers.add_parser('count', help='Count files')
-        file_count.add_argument('pattern', help='File pattern (e.g., *.py)')
-        file_count.add_argument('-r', '--recursive', action='store_true', help='Recursive search')
+    file_count = file_subparsers.add_parser('count', help='Count files')
+    file_count.add_argument('pattern', help='File pattern (e.g., *.py)')
+    file_count.add_argument('-r', '--recursive', action='store_true', help='Recursive search')
 
-        file_size = file_subparsers.add_parser('size', help='Calculate file/directory size')
-        file_size.add_argument('path', help='File or directory path')
-        file_size.add_argument('-h', '--human', action='store_true', help='Human readable')
+    # -h is taken by --human here, so let it override the help short flag
+    file_size = file_subparsers.add_parser('size', help='Calculate file/directory size',
+                                           conflict_handler='resolve')
+    file_size.add_argument('path', help='File or directory path')
+    file_size.add_argument('-h', '--human', action='store_true', help='Human readable')
 
-        file_lines = file_subparsers.add_parser('lines', help='Count lines in files')
-        file_lines.add_argument('pattern', help='File pattern')
-        file_lines.add_argument('-r', '--recursive', action='store_true', help='Recursive')
+    file_lines = file_subparsers.add_parser('lines', help='Count lines in files')
+    file_lines.add_argument('pattern', help='File pattern')
+    file_lines.add_argument('-r', '--recursive', action='store_true', help='Recursive')
 
-        # Text command
-        text_parser = subparsers.add_parser('text', help='Text operations')
-        text_subparsers = text_parser.add_subparsers(dest='text_action')
+    # Text command
+    text_parser = subparsers.add_parser('text', help='Text operations')
+    text_subparsers = text_parser.add_subparsers(dest='text_action')
 
-        text_encode = text_subparsers.add_parser('encode', help='Base64 encode')
-        text_encode.add_argument('text', help='Text to encode')
+    text_encode = text_subparsers.add_parser('encode', help='Base64 encode')
+    text_encode.add_argument('text', help='Text to encode')
 
-        text_decode = text_subparsers.add_parser('decode', help='Base64 decode')
-        text_decode.add_argument('text', help='Text to decode')
+    text_decode = text_subparsers.add_parser('decode', help='Base64 decode')
+    text_decode.add_argument('text', help='Text to decode')
 
-        text_upper = text_subparsers.add_parser('upper', help='Convert to uppercase')
-        text_upper.add_argument('text', help='Text to convert')
+    text_upper = text_subparsers.add_parser('upper', help='Convert to uppercase')
+    text_upper.add_argument('text', help='Text to convert')
 
-        text_lower = text_subparsers.add_parser('lower', help='Convert to lowercase')
-        text_lower.add_argument('text', help='Text to convert')
+    text_lower = text_subparsers.add_parser('lower', help='Convert to lowercase')
+    text_lower.add_argument('text', help='Text to convert')
 
-        # Hash command
-        hash_parser = subparsers.add_parser('hash', help='Hash operations')
-        hash_subparsers = hash_parser.add_subparsers(dest='hash_action')
+    # Hash command
+    hash_parser = subparsers.add_parser('hash', help='Hash operations')
+    hash_subparsers = hash_parser.add_subparsers(dest='hash_action')
 
-        for algo in ['md5', 'sha1', 'sha256', 'sha512']:
-            hash_sub = hash_subparsers.add_parser(algo, help=f'Calculate {algo.upper()} hash')
-            hash_sub.add_argument('input', help='File or text to hash')
-            hash_sub.add_argument('-f', '--file', action='store_true', help='Input is a file')
+    for algo in _HASH_CTORS:
+        hash_sub = hash_subparsers.add_parser(algo, help=f'Calculate {algo.upper()} hash')
+        hash_sub.add_argument('input', help='File or text to hash')
+        hash_sub.add_argument('-f', '--file', action='store_true', help='Input is a file')
 
-        # Search command
-        search_parser = subparsers.add_parser('search', help='Search operations')
-        search_parser.add_argument('pattern', help='Regex pattern to search')
-        search_parser.add_argument('path', help='File or directory to search')
-        search_parser.add_argument('-i', '--ignore-case', action='store_true', help='Case insensitive')
-        search_parser.add_argument('-r', '--recursive', action='store_true', help='Recursive search')
+    # Search command
+    search_parser = subparsers.add_parser('search', help='Search operations')
+    search_parser.add_argument('pattern', help='Regex pattern to search')
+    search_parser.add_argument('path', help='File or directory to search')
+    search_parser.add_argument('-i', '--ignore-case', action='store_true', help='Case insensitive')
+    search_parser.add_argument('-r', '--recursive', action='store_true', help='Recursive search')
 
-        return parser
+    return parser
+
+
+class DevTools:
+    """Main class for developer utilities."""
+
+    def __init__(self):
+        # Dispatch tables: command/action name -> handler taking parsed args
+        self._commands = {
+            'json': self._handle_json,
+            'file': self._handle_file,
+            'text': self._handle_text,
+            'hash': self._handle_hash,
+            'search': self._handle_search,
+        }
+        self._json_actions = {
+            'format': lambda a: self._json_format(a.file, a.indent, a.output),
+            'validate': lambda a: self._json_validate(a.file),
+            'minify': lambda a: self._json_minify(a.file, a.output),
+        }
+        self._file_actions = {
+            'count': lambda a: self._file_count(a.pattern, a.recursive),
+            'size': lambda a: self._file_size(a.path, a.human),
+            'lines': lambda a: self._file_lines(a.pattern, a.recursive),
+        }
+        self._text_actions = {
+            'encode': lambda a: self._text_encode(a.text),
+            'decode': lambda a: self._text_decode(a.text),
+            'upper': lambda a: print(a.text.upper()),
+            'lower': lambda a: print(a.text.lower()),
+        }
+
+    @property
+    def parser(self) -> argparse.ArgumentParser:
+        return _build_parser()
+
+    @staticmethod
+    def _dispatch(table: Dict[str, Callable], key: Optional[str], args):
+        """Call the handler registered for key, if any."""
+        handler = table.get(key)
+        if handler is not None:
+            handler(args)
 
     def run(self, args: List[str] = None):
         """Run the CLI with given arguments."""
@@ -120,41 +296,28 @@ Examples:
             return
 
         # Route to appropriate handler
-        if parsed_args.command == 'json':
-            self._handle_json(parsed_args)
-        elif parsed_args.command == 'file':
-            self._handle_file(parsed_args)
-        elif parsed_args.command == 'text':
-            self._handle_text(parsed_args)
-        elif parsed_args.command == 'hash':
-            self._handle_hash(parsed_args)
-        elif parsed_args.command == 'search':
-            self._handle_search(parsed_args)
+        self._dispatch(self._commands, parsed_args.command, parsed_args)
 
     # JSON Handlers
     def _handle_json(self, args):
         """Handle JSON operations."""
-        if args.json_action == 'format':
-            self._json_format(args.file, args.indent, args.output)
-        elif args.json_action == 'validate':
-            self._json_validate(args.file)
-        elif args.json_action == 'minify':
-            self._json_minify(args.file, args.output)
+        self._dispatch(self._json_actions, args.json_action, args)
 
     def _json_format(self, file: str, indent: int, output: Optional[str]):
         """Format a JSON file."""
         try:
             with open(file, 'r') as f:
-                data = json.load(f)
+                data = _JSON_DECODER.decode(f.read())
 
-            formatted = json.dumps(data, indent=indent, sort_keys=True)
+            encoder = _json_format_encoder(indent)
 
             if output:
                 with open(output, 'w') as f:
-                    f.write(formatted)
+                    _write_json(encoder, data, f)
                 print(f"Formatted JSON written to {output}")
             else:
-                print(formatted)
+                _write_json(encoder, data, sys.stdout)
+                print()
         except json.JSONDecodeError as e:
             print(f"Error: Invalid JSON - {e}", file=sys.stderr)
             sys.exit(1)
@@ -166,7 +329,7 @@ Examples:
         """Validate a JSON file."""
         try:
             with open(file, 'r') as f:
-                json.load(f)
+                _JSON_DECODER.decode(f.read())
             print(f"✓ {file} is valid JSON")
         except json.JSONDecodeError as e:
             print(f"✗ Invalid JSON: {e}", file=sys.stderr)
@@ -179,16 +342,15 @@ Examples:
         """Minify a JSON file."""
         try:
             with open(file, 'r') as f:
-                data = json.load(f)
-
-            minified = json.dumps(data, separators=(',', ':'))
+                data = _JSON_DECODER.decode(f.read())
 
             if output:
                 with open(output, 'w') as f:
-                    f.write(minified)
+                    _write_json(_JSON_MINIFY_ENCODER, data, f)
                 print(f"Minified JSON written to {output}")
             else:
-                print(minified)
+                _write_json(_JSON_MINIFY_ENCODER, data, sys.stdout)
+                print()
         except json.JSONDecodeError as e:
             print(f"Error: Invalid JSON - {e}", file=sys.stderr)
             sys.exit(1)
@@ -196,19 +358,11 @@ Examples:
     # File Handlers
     def _handle_file(self, args):
         """Handle file operations."""
-        if args.file_action == 'count':
-            self._file_count(args.pattern, args.recursive)
-        elif args.file_action == 'size':
-            self._file_size(args.path, args.human)
-        elif args.file_action == 'lines':
-            self._file_lines(args.pattern, args.recursive)
+        self._dispatch(self._file_actions, args.file_action, args)
 
     def _file_count(self, pattern: str, recursive: bool):
         """Count files matching pattern."""
-        if recursive:
-            files = list(Path('.').rglob(pattern))
-        else:
-            files = list(Path('.').glob(pattern))
+        files = [path for path, _ in _walk('.', pattern, recursive)]
 
         print(f"Found {len(files)} files matching '{pattern}'")
         for f in files:
@@ -225,7 +379,9 @@ Examples:
         if p.is_file():
             size = p.stat().st_size
         else:
-            size = sum(f.stat().st_size for f in p.rglob('*') if f.is_file())
+            files = [entry for _, entry in _walk(path, recursive=True) if entry.is_file()]
+            with ThreadPoolExecutor(max_workers=IO_WORKERS) as pool:
+                size = sum(pool.map(_entry_size, files))
 
         if human:
             size_str = self._human_readable_size(size)
@@ -236,48 +392,46 @@ Examples:
 
     def _human_readable_size(self, size: int) -> str:
         """Convert bytes to human readable format."""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size < 1024.0:
-                return f"{size:.2f} {unit}"
-            size /= 1024.0
-        return f"{size:.2f} PB"
+        # Each unit is 2**10 times the previous one, so the unit index is
+        # just the bit length divided by 10
+        idx = min((size.bit_length() - 1) // 10, len(SIZE_UNITS) - 1) if size > 0 else 0
+        return f"{size / (1 << (10 * idx)):.2f} {SIZE_UNITS[idx]}"
 
     def _file_lines(self, pattern: str, recursive: bool):
         """Count lines in files."""
-        if recursive:
-            files = list(Path('.').rglob(pattern))
-        else:
-            files = list(Path('.').glob(pattern))
+        files = [path for path, _ in _walk('.', pattern, recursive)]
 
+        with ThreadPoolExecutor(max_workers=IO_WORKERS) as pool:
+            results = list(pool.map(_try_count_lines, files))
+
+        # Report from the main thread so output order matches the file list
         total_lines = 0
-        for f in files:
-            try:
-                with open(f, 'r') as file:
-                    lines = len(file.readlines())
-                    print(f"{f}: {lines} lines")
-                    total_lines += lines
-            except Exception as e:
-                print(f"Error reading {f}: {e}", file=sys.stderr)
+        for f, (lines, error) in zip(files, results):
+            if error is not None:
+                print(f"Error reading {f}: {error}", file=sys.stderr)
+                continue
+            print(f"{f}: {lines} lines")
+            total_lines += lines
 
         print(f"\nTotal: {total_lines} lines across {len(files)} files")
 
     # Text Handlers
     def _handle_text(self, args):
         """Handle text operations."""
-        if args.text_action == 'encode':
-            encoded = base64.b64encode(args.text.encode()).decode()
-            print(encoded)
-        elif args.text_action == 'decode':
-            try:
-                decoded = base64.b64decode(args.text.encode()).decode()
-                print(decoded)
-            except Exception as e:
-                print(f"Error: Invalid base64 - {e}", file=sys.stderr)
-                sys.exit(1)
-        elif args.text_action == 'upper':
-            print(args.text.upper())
-        elif args.text_action == 'lower':
-            print(args.text.lower())
+        self._dispatch(self._text_actions, args.text_action, args)
+
+    def _text_encode(self, text: str):
+        """Base64 encode text."""
+        print(binascii.b2a_base64(text.encode(), newline=False).decode('ascii'))
+
+    def _text_decode(self, text: str):
+        """Base64 decode text."""
+        try:
+            decoded = binascii.a2b_base64(text).decode()
+            print(decoded)
+        except ValueError as e:  # binascii.Error, UnicodeDecodeError, non-ASCII input
+            print(f"Error: Invalid base64 - {e}", file=sys.stderr)
+            sys.exit(1)
 
     # Hash Handlers
     def _handle_hash(self, args):
@@ -287,41 +441,90 @@ Examples:
         if args.file:
             try:
                 with open(args.input, 'rb') as f:
-                    data = f.read()
+                    hasher = _hash_file(f, algo)
             except FileNotFoundError:
                 print(f"Error: File not found - {args.input}", file=sys.stderr)
                 sys.exit(1)
         else:
-            data = args.input.encode()
-
-        if algo == 'md5':
-            h = hashlib.md5(data).hexdigest()
-        elif algo == 'sha1':
-            h = hashlib.sha1(data).hexdigest()
-        elif algo == 'sha256':
-            h = hashlib.sha256(data).hexdigest()
-        elif algo == 'sha512':
-            h = hashlib.sha512(data).hexdigest()
+            hasher = _new_hasher(algo, args.input.encode())
 
-        print(f"{algo.upper()}: {h}")
+        print(f"{algo.upper()}: {hasher.hexdigest()}")
 
     # Search Handler
     def _handle_search(self, args):
         """Handle search operations."""
-        pattern = re.compile(args.pattern, re.IGNORECASE if args.ignore_case else 0)
+        flags = re.IGNORECASE if args.ignore_case else 0
+        pattern = re.compile(args.pattern, flags)
+        # Bytes twin for the mmap fast path, only where scanning the whole
+        # file cannot miss a line the per-line search matches: ASCII-only,
+        # and no assertion that depends on what follows a line's newline
+        # (\A, \Z, $, \b, \B, lookaround). MULTILINE lets ^ find line starts.
+        byte_pattern = None
+        if args.pattern.isascii() and not _LINE_CONTEXT.search(args.pattern):
+            byte_pattern = re.compile(args.pattern.encode(), flags | re.MULTILINE)
         path = Path(args.path)
 
         if path.is_file():
-            self._search_file(path, pattern)
+            self._search_file(path, pattern, byte_pattern)
         elif path.is_dir() and args.recursive:
-            for f in path.rglob('*'):
-                if f.is_file():
-                    self._search_file(f, pattern)
+            for f, entry in _walk(args.path, recursive=True):
+                if entry.is_file():
+                    self._search_file(f, pattern, byte_pattern)
         else:
             print(f"Error: {args.path} is not a file or use -r for directories", file=sys.stderr)
 
-    def _search_file(self, file: Path, pattern: re.Pattern):
-        """Search for pattern in a file."""
+    def _search_file(self, file: Path, pattern: re.Pattern,
+                     byte_pattern: Optional[re.Pattern] = None):
+        """
+        Search for pattern in a file.
+        Plain ASCII files (no CR, no bytes \\s treats differently from str
+        \\s) are scanned with byte_pattern over the memory-mapped file;
+        everything else, including files that cannot be mapped (empty or
+        /proc files), is decoded and searched line by line.
+        """
+        try:
+            with open(file, 'rb') as f:
+                try:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (ValueError, OSError):
+                    mm = None
+                if mm is not None:
+                    with mm:
+                        if byte_pattern is not None and not _NOT_PLAIN_ASCII.search(mm):
+                            self._search_mmap(file, mm, pattern, byte_pattern)
+                            return
+        except OSError:
+            return  # Skip files that can't be opened
+        self._search_lines(file, pattern)
+
+    def _search_mmap(self, file: Path, mm: mmap.mmap, pattern: re.Pattern,
+                     byte_pattern: re.Pattern):
+        """
+        One regex scan over a mapped plain ASCII file.
+        Each hit only nominates its line: the line is then checked with the
+        str pattern exactly as the per-line search sees it, and the scan
+        resumes at the next line.
+        """
+        size = len(mm)
+        line_no = 1
+        counted = 0
+        pos = 0
+        while pos <= size and (m := byte_pattern.search(mm, pos)) is not None:
+            start = mm.rfind(b'\n', 0, m.start()) + 1
+            if start >= size:
+                break
+            end = mm.find(b'\n', m.start())
+            if end == -1:
+                end = size
+            line = mm[start:end + 1].decode('ascii')
+            if pattern.search(line):
+                line_no += mm[counted:start].count(b'\n')
+                counted = start
+                print(f"{file}:{line_no}: {line.rstrip()}")
+            pos = end + 1
+
+    def _search_lines(self, file: Path, pattern: re.Pattern):
+        """Search a file line by line as decoded text (universal newlines)."""
         try:
             with open(file, 'r') as f:
                 for i, line in enumerate(f, 1):
@@ -0,0 +1,109 @@
+"""
+Tests for the DevTools CLI.
+"""
+
+import os
+import pytest
+import devtools
+from devtools import DevTools
+
+
+class TestSearch:
+    """Test suite for the search command."""
+
+    @pytest.fixture
+    def cli(self):
+        """Create a CLI instance for testing."""
+        return DevTools()
+
+    def search(self, cli, capsys, path, *args):
+        """Run a search and return the matched line numbers."""
+        cli.run(['search', *args, str(path)])
+        lines = capsys.readouterr().out.splitlines()
+        prefix = f"{path}:"
+        return [int(line[len(prefix):].split(':', 1)[0]) for line in lines]
+
+    def test_plain_ascii_file(self, cli, capsys, tmp_path):
+        """Test the memory-mapped scan reports each matching line once."""
+        path = tmp_path / 'plain.txt'
+        path.write_bytes(b'hello world\nnothing\nworld world\nhello\n')
+
+        assert self.search(cli, capsys, path, 'world') == [1, 3]
+        assert self.search(cli, capsys, path, '^hello') == [1, 4]
+        assert self.search(cli, capsys, path, 'world$') == [1, 3]
+
+    def test_crlf_line_endings(self, cli, capsys, tmp_path):
+        """Test $ matches before CRLF line endings, as in text mode."""
+        path = tmp_path / 'crlf.txt'
+        path.write_bytes(b'hello world\r\nworld peace\r\nsay world\r\n')
+
+        assert self.search(cli, capsys, path, 'world$') == [1, 3]
+        assert capsys.readouterr().out == ''
+
+        cli.run(['search', 'peace$', str(path)])
+        assert capsys.readouterr().out == f"{path}:2: world peace\n"
+
+    def test_ignore_case_non_ascii(self, cli, capsys, tmp_path):
+        """Test -i folds non-ASCII text like the str regex does."""
+        path = tmp_path / 'cafe.txt'
+        path.write_text('un café\nUN CAFÉ\ncafe\n', encoding='utf-8')
+
+        assert self.search(cli, capsys, path, 'CAFÉ', '-i') == [1, 2]
+        assert self.search(cli, capsys, path, 'café') == [1]
+
+    def test_ignore_case_ascii_pattern_non_ascii_text(self, cli, capsys, tmp_path):
+        """Test an ASCII pattern still folds Unicode text (Kelvin sign)."""
+        path = tmp_path / 'kelvin.txt'
+        path.write_text('0 K\nk\n', encoding='utf-8')
+
+        assert self.search(cli, capsys, path, 'k', '-i') == [1, 2]
+
+    def test_anchors_apply_per_line(self, cli, capsys, tmp_path):
+        r"""Test \A and \Z anchor to each line, not to the file."""
+        path = tmp_path / 'anchors.txt'
+        path.write_bytes(b'one\ntwo\nthree\n')
+
+        assert self.search(cli, capsys, path, r'\At') == [2, 3]
+        assert self.search(cli, capsys, path, r'e\n\Z') == [1, 3]
+
+    def test_matches_do_not_span_lines(self, cli, capsys, tmp_path):
+        """Test a pattern matching across a newline is not reported."""
+        path = tmp_path / 'span.txt'
+        path.write_bytes(b'foo\nbar\nfoo bar\n')
+
+        assert self.search(cli, capsys, path, r'foo\sbar') == [3]
+
+    def test_line_end_assertions(self, cli, capsys, tmp_path):
+        r"""Test $, \b and \B see each line end, not the next line."""
+        path = tmp_path / 'ends.txt'
+        path.write_bytes(b'a\nb \nc\n')
+
+        assert self.search(cli, capsys, path, r'\s$') == [1, 2, 3]
+        assert self.search(cli, capsys, path, r'\W$') == [1, 2, 3]
+        assert self.search(cli, capsys, path, r'\n\B') == [1, 2, 3]
+        assert self.search(cli, capsys, path, r'\B\n') == [2]
+        assert self.search(cli, capsys, path, r'a\b') == [1]
+
+    def test_unmappable_file_falls_back(self, cli, capsys, tmp_path, monkeypatch):
+        """Test files mmap rejects are still searched line by line."""
+        path = tmp_path / 'special.txt'
+        path.write_bytes(b'cpu\nprocessor : 0\n')
+
+        def refuse(*args, **kwargs):
+            raise ValueError('cannot mmap an empty file')
+
+        monkeypatch.setattr(devtools.mmap, 'mmap', refuse)
+
+        assert self.search(cli, capsys, path, 'processor') == [2]
+
+    @pytest.mark.skipif(not os.path.exists('/proc/cpuinfo'), reason='needs /proc')
+    def test_proc_file(self, cli, capsys):
+        """Test zero-length /proc files are searched like regular files."""
+        with open('/proc/cpuinfo') as f:
+            expected = [i for i, line in enumerate(f, 1) if 'processor' in line]
+
+        assert self.search(cli, capsys, '/proc/cpuinfo', 'processor') == expected
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -8,35 +8,173 @@ It includes data loading, cleaning, transformation, analysis, and export.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import json
+import warnings
 from pathlib import Path
 
+try:
+    # Optional: pandas already uses pyarrow for Parquet; when present it
+    # also provides a lower-memory Parquet-to-pandas conversion
+    import pyarrow as pa
+    import pyarrow.parquet as pa_parquet
+except ImportError:
+    pa = None
+
+DEPARTMENTS = ['Engineering', 'Sales', 'Marketing', 'HR', 'Finance']
+EXPORT_FORMATS = ('csv', 'parquet', 'xlsx', 'json')
+DEFAULT_EXPORT_FORMATS = ('csv', 'json')
+NS_PER_DAY = 86_400 * 10**9
+# Numeric columns added by transform_data, in the order they are created
+NUMERIC_FEATURES = ['years_with_company', 'salary_per_performance', 'performance_percentage']
+
+
+def _clean_numeric(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Median-fill missing values and cap IQR outliers, column-wise, in place.
+
+    Args:
+        values: 2-D float64 array (rows x numeric columns), NaN for missing
+
+    Returns:
+        Tuple of per-column counts (values filled, outliers capped)
+    """
+    if values.size == 0:
+        return np.zeros(values.shape[1], dtype=int), np.zeros(values.shape[1], dtype=int)
+
+    missing = np.isnan(values)
+    filled = missing.sum(axis=0)
+    if filled.any():
+        with warnings.catch_warnings():
+            # All-NaN columns have no median and stay NaN, as with pandas
+            warnings.simplefilter('ignore', RuntimeWarning)
+            medians = np.nanmedian(values, axis=0)
+        np.copyto(values, np.broadcast_to(medians, values.shape), where=missing)
+
+    with np.errstate(invalid='ignore'):
+        # Infinite values make the IQR NaN (inf - inf)
+        q1, q3 = np.quantile(values, [0.25, 0.75], axis=0)
+        iqr = q3 - q1
+        lower_bound = q1 - 1.5 * iqr
+        upper_bound = q3 + 1.5 * iqr
+    # A NaN bound does not clip, as with DataFrame.clip()
+    lower_bound[np.isnan(lower_bound)] = -np.inf
+    upper_bound[np.isnan(upper_bound)] = np.inf
+
+    outliers = ((values < lower_bound) | (values > upper_bound)).sum(axis=0)
+    np.clip(values, lower_bound, upper_bound, out=values)
+    return filled, outliers
+
+
+def _reduceat_agg(codes: np.ndarray, values: Dict[str, np.ndarray],
+                  funcs: Dict[str, Tuple[str, str]],
+                  n_groups: Optional[int] = None) -> Dict[str, np.ndarray]:
+    """
+    Per-group reductions over integer group codes with one sort.
+
+    Matches ``groupby(observed=False).agg()``: groups with no rows get a
+    count of 0 and NaN for every other reduction.
+
+    Args:
+        codes: Group code per row (0..n_groups-1), -1 for missing
+        values: Float64 column arrays aligned with ``codes``, NaN for missing
+        funcs: Output name -> (column, one of 'count'/'mean'/'median'/'min'/'max')
+        n_groups: Number of groups (defaults to the largest code + 1)
+
+    Returns:
+        Output name -> array with one entry per group code
+    """
+    if n_groups is None:
+        n_groups = int(codes.max()) + 1 if codes.size else 0
+    keep = codes >= 0
+    order = np.argsort(codes[keep], kind='stable')
+    sorted_codes = codes[keep][order]
+    if sorted_codes.size == 0:
+        return {name: np.zeros(n_groups, dtype=np.int64) if func == 'count'
+                else np.full(n_groups, np.nan)
+                for name, (_, func) in funcs.items()}
+    boundaries = np.flatnonzero(np.diff(sorted_codes, prepend=-1, append=-1))
+    starts = boundaries[:-1]
+    observed = sorted_codes[starts]
+
+    sorted_values = {}
+    results = {}
+    for name, (column, func) in funcs.items():
+        if column not in sorted_values:
+            sorted_values[column] = values[column][keep][order]
+        column_values = sorted_values[column]
+        present = ~np.isnan(column_values)
+        # Like pandas, every reduction skips NaNs
+        if func == 'count':
+            results[name] = np.add.reduceat(present, starts, dtype=np.int64)
+        elif func == 'mean':
+            totals = np.add.reduceat(np.where(present, column_values, 0.0), starts)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                results[name] = totals / np.add.reduceat(present, starts, dtype=np.int64)
+        elif func == 'min':
+            results[name] = np.fmin.reduceat(column_values, starts)
+        elif func == 'max':
+            results[name] = np.fmax.reduceat(column_values, starts)
+        elif func == 'median':
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)
+                results[name] = np.array([
+                    np.nanmedian(segment)
+                    for segment in np.split(column_values, starts[1:])
+                ])
+        else:
+            raise ValueError(f"Unsupported aggregation: {func}")
+
+        if observed.size < n_groups:
+            # Scatter the observed groups' results into every group's slot
+            reduced = results[name]
+            results[name] = (np.zeros(n_groups, dtype=np.int64) if func == 'count'
+                             else np.full(n_groups, np.nan))
+            results[name][observed] = reduced
+    return results
+
 
 class DataPipeline:
     """
     A comprehensive data processing pipeline for ETL operations.
     """
 
-    def __init__(self, input_path: Optional[str] = None):
+    def __init__(self, input_path: Optional[str] = None, verbose: bool = False,
+                 seed: Optional[int] = 42):
         """
         Initialize the data pipeline.
 
         Args:
             input_path: Path to the input data file
+            verbose: Report missing-value counts while cleaning (costs two
+                full passes over the frame)
+            seed: Seed for this pipeline's random generator (sample data)
         """
         self.input_path = input_path
+        self.verbose = verbose
+        # Per-instance PCG64 generator: no global RNG state shared between
+        # pipelines running in other threads or processes
+        self._rng = np.random.default_rng(seed)
         self.data: Optional[pd.DataFrame] = None
         self.cleaned_data: Optional[pd.DataFrame] = None
         self.transformed_data: Optional[pd.DataFrame] = None
         self.results: Dict = {}
-
-    def load_data(self, file_path: Optional[str] = None) -> pd.DataFrame:
+        # Column lists by dtype, inspected once per run in clean_data
+        self._num_cols: Optional[List[str]] = None
+        self._cat_cols: Optional[List[str]] = None
+        # Parquet footers by (path, mtime, size), so re-reading a file skips
+        # re-parsing its metadata
+        self._parquet_metadata: Dict[Tuple[str, int, int], object] = {}
+
+    def load_data(self, file_path: Optional[str] = None,
+                  columns: Optional[List[str]] = None) -> pd.DataFrame:
         """
         Load data from various file formats.
 
         Args:
             file_path: Path to the data file
+            columns: Only read these columns (pushed down into the CSV,
+                Excel and Parquet readers so unused columns are never parsed)
 
         Returns:
             Loaded DataFrame
@@ -52,19 +190,51 @@ class DataPipeline:
         file_extension = Path(path).suffix.lower()
 
         if file_extension == '.csv':
-            self.data = pd.read_csv(path)
+            self.data = pd.read_csv(path, usecols=columns, memory_map=True)
         elif file_extension in ['.xlsx', '.xls']:
-            self.data = pd.read_excel(path)
+            self.data = pd.read_excel(path, usecols=columns)
         elif file_extension == '.json':
             self.data = pd.read_json(path)
+            if columns is not None:
+                self.data = self.data[columns]
         elif file_extension == '.parquet':
-            self.data = pd.read_parquet(path)
+            if pa is not None:
+                table = self._read_parquet_table(path, columns)
+                # self_destruct releases each Arrow column as soon as it is
+                # converted, so peak memory stays near one copy of the data
+                # instead of the Arrow table plus the DataFrame
+                self.data = table.to_pandas(split_blocks=True, self_destruct=True)
+                del table
+            else:
+                self.data = pd.read_parquet(path, columns=columns)
         else:
             raise ValueError(f"Unsupported file format: {file_extension}")
 
         print(f"Loaded {len(self.data)} records from {path}")
         return self.data
 
+    def _read_parquet_table(self, path: str, columns: Optional[List[str]] = None):
+        """
+        Read a Parquet file (or dataset directory) into an Arrow table.
+
+        Args:
+            path: Path to the Parquet file or directory
+            columns: Only read these columns
+
+        Returns:
+            pyarrow Table
+        """
+        if not Path(path).is_file():
+            return pa_parquet.read_table(path, columns=columns, memory_map=True)
+
+        stat = Path(path).stat()
+        key = (str(path), stat.st_mtime_ns, stat.st_size)
+        metadata = self._parquet_metadata.get(key)
+        if metadata is None:
+            metadata = self._parquet_metadata[key] = pa_parquet.read_metadata(path)
+        parquet_file = pa_parquet.ParquetFile(path, metadata=metadata, memory_map=True)
+        return parquet_file.read(columns=columns)
+
     def _generate_sample_data(self, n_records: int = 1000) -> pd.DataFrame:
         """
         Generate sample data for demonstration.
@@ -75,24 +245,34 @@ class DataPipeline:
         Returns:
             Sample DataFrame
         """
-        np.random.seed(42)
-
+        # Values use the narrowest dtype that holds them (int8 ages, int32
+        # salaries, float32 scores) to cut memory while generating;
+        # clean_data widens float32 columns back to float64
+        rng = self._rng
+
+        # name/email stay as list comprehensions: with object-dtype strings,
+        # np.char.add / pandas string concatenation are 2-4x slower than
+        # f-strings; only Arrow-backed strings (pyarrow) would beat them.
         data = {
             'id': range(1, n_records + 1),
             'name': [f'User_{i}' for i in range(1, n_records + 1)],
-            'age': np.random.randint(18, 80, n_records),
+            'age': rng.integers(18, 80, n_records, dtype=np.int8),
             'email': [f'user{i}@example.com' for i in range(1, n_records + 1)],
-            'salary': np.random.randint(30000, 150000, n_records),
-            'department': np.random.choice(['Engineering', 'Sales', 'Marketing', 'HR', 'Finance'], n_records),
+            'salary': rng.integers(30000, 150000, n_records, dtype=np.int32),
+            # Categorical: int8 codes plus a 5-entry dictionary instead of
+            # one Python string per row
+            'department': pd.Categorical.from_codes(
+                rng.integers(0, len(DEPARTMENTS), n_records, dtype=np.int8),
+                categories=DEPARTMENTS),
             'join_date': pd.date_range('2020-01-01', periods=n_records, freq='D'),
-            'performance_score': np.random.uniform(1.0, 5.0, n_records),
-            'is_active': np.random.choice([True, False], n_records, p=[0.9, 0.1])
+            'performance_score': rng.uniform(1.0, 5.0, n_records).astype(np.float32),
+            'is_active': rng.random(n_records) < 0.9
         }
 
         # Introduce some missing values and outliers
         df = pd.DataFrame(data)
-        df.loc[np.random.choice(df.index, 50, replace=False), 'salary'] = np.nan
-        df.loc[np.random.choice(df.index, 30, replace=False), 'performance_score'] = np.nan
+        df.loc[rng.choice(n_records, 50, replace=False), 'salary'] = np.nan
+        df.loc[rng.choice(n_records, 30, replace=False), 'performance_score'] = np.nan
 
         return df
 
@@ -106,48 +286,59 @@ class DataPipeline:
         if self.data is None:
             raise ValueError("No data loaded. Call load_data() first.")
 
-        df = self.data.copy()
+        df = self.data
 
         print(f"\nCleaning data...")
         print(f"Initial shape: {df.shape}")
 
-        # Remove duplicates
+        # Remove duplicates. drop_duplicates already returns a new frame, so
+        # the columns replaced below never write through to self.data; the
+        # shallow copy only detaches it from pandas' chained-assignment check
         initial_count = len(df)
-        df = df.drop_duplicates()
+        df = df.drop_duplicates().copy(deep=False)
         duplicates_removed = initial_count - len(df)
         print(f"Duplicates removed: {duplicates_removed}")
 
         # Handle missing values
-        missing_before = df.isnull().sum().sum()
-
-        # Fill numeric columns with median
-        numeric_columns = df.select_dtypes(include=[np.number]).columns
-        for col in numeric_columns:
-            if df[col].isnull().any():
-                df[col].fillna(df[col].median(), inplace=True)
-
-        # Fill categorical columns with mode
-        categorical_columns = df.select_dtypes(include=['object']).columns
-        for col in categorical_columns:
-            if df[col].isnull().any():
-                df[col].fillna(df[col].mode()[0], inplace=True)
-
-        missing_after = df.isnull().sum().sum()
-        print(f"Missing values handled: {missing_before} -> {missing_after}")
-
-        # Handle outliers using IQR method
-        for col in numeric_columns:
-            Q1 = df[col].quantile(0.25)
-            Q3 = df[col].quantile(0.75)
-            IQR = Q3 - Q1
-            lower_bound = Q1 - 1.5 * IQR
-            upper_bound = Q3 + 1.5 * IQR
-
-            outliers = ((df[col] < lower_bound) | (df[col] > upper_bound)).sum()
-            if outliers > 0:
-                print(f"Outliers in {col}: {outliers}")
-                # Cap outliers instead of removing
-                df[col] = df[col].clip(lower_bound, upper_bound)
+        if self.verbose:
+            missing_before = int(df.isna().to_numpy().sum())
+
+        # Inspect dtypes once; cleaning does not change which columns are
+        # numeric or categorical, so later stages reuse these lists
+        self._num_cols = list(df.select_dtypes(include=[np.number]).columns)
+        self._cat_cols = list(df.select_dtypes(include=['object', 'category']).columns)
+
+        # Numeric columns: median fill and IQR capping in one NumPy kernel
+        # over a single contiguous array
+        numeric_columns = pd.Index(self._num_cols)
+        values = df[numeric_columns].to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+        filled, outliers = _clean_numeric(values)
+
+        # Only write back columns the kernel changed so the rest keep their
+        # dtype; float32 columns are always written back as float64 so that
+        # derived features, aggregates and exports keep full precision
+        narrow_float = np.array([df[col].dtype == np.float32 for col in numeric_columns],
+                                dtype=bool)
+        changed = (filled > 0) | (outliers > 0) | narrow_float
+        if changed.any():
+            df[numeric_columns[changed]] = values[:, changed]
+
+        # Categorical columns: fill with mode, only where NaNs are present
+        # (mode() over unique-valued text columns is costly)
+        categorical_columns = pd.Index(self._cat_cols)
+        has_missing = df[categorical_columns].isnull().any().to_numpy()
+        if has_missing.any():
+            categorical_missing = categorical_columns[has_missing]
+            df = df.fillna(df[categorical_missing].mode().iloc[0].to_dict())
+
+        if self.verbose:
+            missing_after = int(df.isna().to_numpy().sum())
+            print(f"Missing values handled: {missing_before} -> {missing_after}")
+
+        # Outliers were capped instead of removed
+        for col, count in zip(numeric_columns, outliers):
+            if count > 0:
+                print(f"Outliers in {col}: {count}")
 
         print(f"Final shape: {df.shape}")
 
@@ -164,23 +355,32 @@ class DataPipeline:
         if self.cleaned_data is None:
             raise ValueError("No cleaned data. Call clean_data() first.")
 
-        df = self.cleaned_data.copy()
+        df = self.cleaned_data
 
         print(f"\nTransforming data...")
 
-        # Feature engineering
-        df['years_with_company'] = (pd.Timestamp.now() - df['join_date']).dt.days / 365.25
-        df['salary_per_performance'] = df['salary'] / df['performance_score']
-        df['age_group'] = pd.cut(df['age'], bins=[0, 30, 45, 60, 100],
-                                  labels=['Young', 'Mid-Career', 'Senior', 'Veteran'])
-
-        # Normalize performance score to 0-100 scale
-        df['performance_percentage'] = (df['performance_score'] / 5.0) * 100
-
-        # Create salary bands
-        df['salary_band'] = pd.cut(df['salary'],
-                                    bins=[0, 50000, 75000, 100000, 150000],
-                                    labels=['Low', 'Medium', 'High', 'Very High'])
+        # Feature engineering: all derived columns are added in one assign()
+        # call, which returns a new frame and leaves cleaned_data untouched
+        # Tenure in whole days straight from the int64 epoch nanoseconds
+        # (floor division matches Timedelta.days), without a Timedelta
+        # Series and .dt accessor in between
+        join_ns = df['join_date'].to_numpy(dtype='datetime64[ns]').view(np.int64)
+        tenure_days = (pd.Timestamp.now().value - join_ns) // NS_PER_DAY
+        years_with_company = tenure_days / 365.25
+        years_with_company[join_ns == np.iinfo(np.int64).min] = np.nan  # NaT
+
+        df = df.assign(
+            years_with_company=years_with_company,
+            salary_per_performance=df['salary'] / df['performance_score'],
+            age_group=pd.cut(df['age'], bins=[0, 30, 45, 60, 100],
+                             labels=['Young', 'Mid-Career', 'Senior', 'Veteran']),
+            # Normalize performance score to 0-100 scale
+            performance_percentage=(df['performance_score'] / 5.0) * 100,
+            # Create salary bands
+            salary_band=pd.cut(df['salary'],
+                               bins=[0, 50000, 75000, 100000, 150000],
+                               labels=['Low', 'Medium', 'High', 'Very High']),
+        )
 
         print(f"New features created: {len(df.columns) - len(self.cleaned_data.columns)}")
 
@@ -218,60 +418,102 @@ class DataPipeline:
             'average_performance': float(df['performance_score'].mean())
         }
 
-        # Department analysis
-        dept_stats = df.groupby('department').agg({
-            'id': 'count',
-            'salary': ['mean', 'median', 'min', 'max'],
-            'performance_score': 'mean',
-            'age': 'mean'
-        }).round(2)
-
-        results['department_analysis'] = dept_stats.to_dict()
-
-        # Age group analysis
-        age_stats = df.groupby('age_group').agg({
-            'id': 'count',
-            'salary': 'mean',
-            'performance_score': 'mean'
-        }).round(2)
-
-        results['age_analysis'] = age_stats.to_dict()
-
-        # Salary band analysis
-        salary_stats = df.groupby('salary_band').agg({
-            'id': 'count',
-            'performance_score': 'mean',
-            'years_with_company': 'mean'
-        }).round(2)
-
-        results['salary_analysis'] = salary_stats.to_dict()
-
-        # Performance analysis
-        high_performers = df[df['performance_score'] >= 4.0]
-        low_performers = df[df['performance_score'] < 2.5]
+        # Group analyses: convert each aggregated column to float64 once and
+        # reduce over integer group codes (sorted once per key) instead of
+        # building a separate groupby hashtable for every analysis.
+        # Department stats use flat "<column>_<stat>" names (groupby's
+        # (column, stat) tuple keys cannot be written by json.dump).
+        group_specs = {
+            'department_analysis': ('department', {
+                'id_count': ('id', 'count'),
+                'salary_mean': ('salary', 'mean'),
+                'salary_median': ('salary', 'median'),
+                'salary_min': ('salary', 'min'),
+                'salary_max': ('salary', 'max'),
+                'performance_score_mean': ('performance_score', 'mean'),
+                'age_mean': ('age', 'mean'),
+            }),
+            'age_analysis': ('age_group', {
+                'id': ('id', 'count'),
+                'salary': ('salary', 'mean'),
+                'performance_score': ('performance_score', 'mean'),
+            }),
+            'salary_analysis': ('salary_band', {
+                'id': ('id', 'count'),
+                'performance_score': ('performance_score', 'mean'),
+                'years_with_company': ('years_with_company', 'mean'),
+            }),
+        }
+        columns = {column for _, funcs in group_specs.values() for column, _ in funcs.values()}
+        values = {column: df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+                  for column in columns}
+
+        for result_key, (group_column, funcs) in group_specs.items():
+            # Groups as groupby lists them: every category in category order
+            # for Categoricals (empty ones included), sorted values otherwise
+            column = df[group_column]
+            if isinstance(column.dtype, pd.CategoricalDtype):
+                codes = column.cat.codes.to_numpy()
+                groups = column.cat.categories
+            else:
+                codes, groups = pd.factorize(column, sort=True)
+            stats = pd.DataFrame(_reduceat_agg(codes, values, funcs, len(groups)),
+                                 index=pd.Index(np.asarray(groups)))
+            results[result_key] = stats.round(2).to_dict()
+
+        # Performance analysis: reduce the salary column under boolean masks
+        # instead of materialising filtered copies of the whole frame
+        salary = df['salary']
+        high_performers = (df['performance_score'] >= 4.0).to_numpy()
+        low_performers = (df['performance_score'] < 2.5).to_numpy()
 
         results['performance_analysis'] = {
-            'high_performers_count': len(high_performers),
-            'high_performers_avg_salary': float(high_performers['salary'].mean()),
-            'low_performers_count': len(low_performers),
-            'low_performers_avg_salary': float(low_performers['salary'].mean())
+            'high_performers_count': int(high_performers.sum()),
+            'high_performers_avg_salary': float(salary[high_performers].mean()),
+            'low_performers_count': int(low_performers.sum()),
+            'low_performers_avg_salary': float(salary[low_performers].mean())
         }
 
         # Correlation analysis
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
-        correlations = df[numeric_cols].corr()['salary'].sort_values(ascending=False)
+        if self._num_cols is None:
+            numeric_cols = df.select_dtypes(include=[np.number]).columns
+        else:
+            numeric_cols = self._num_cols + NUMERIC_FEATURES
+        # Only the salary column of the correlation matrix is reported, so
+        # standardise once and take K dot products instead of corr()'s K x K
+        matrix = df[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+        if np.isnan(matrix).any():
+            # Pairwise-complete correlations, as corr() computes them
+            correlations = df[numeric_cols].corrwith(df['salary'])
+        else:
+            with np.errstate(invalid='ignore', divide='ignore'):
+                standardized = (matrix - matrix.mean(axis=0)) / matrix.std(axis=0)
+                target = standardized[:, list(numeric_cols).index('salary')]
+                correlations = pd.Series(target @ standardized / len(matrix),
+                                         index=numeric_cols)
+            # Constant columns stay NaN, as with corr(); clip rounding past +-1
+            correlations = correlations.clip(-1.0, 1.0)
+        correlations = correlations.sort_values(ascending=False)
         results['salary_correlations'] = correlations.to_dict()
 
         self.results = results
         return results
 
-    def export_data(self, output_dir: str = 'output') -> None:
+    def export_data(self, output_dir: str = 'output',
+                    formats: Tuple[str, ...] = DEFAULT_EXPORT_FORMATS) -> None:
         """
         Export processed data and analysis results.
 
         Args:
             output_dir: Directory to save output files
+            formats: Output formats to write, any of 'csv', 'parquet',
+                'xlsx' and 'json' (analysis results). Excel is opt-in: the
+                openpyxl writer is by far the slowest step of the pipeline.
         """
+        unsupported = set(formats) - set(EXPORT_FORMATS)
+        if unsupported:
+            raise ValueError(f"Unsupported export format: {', '.join(sorted(unsupported))}")
+
         output_path = Path(output_dir)
         output_path.mkdir(exist_ok=True)
 
@@ -279,16 +521,27 @@ class DataPipeline:
 
         # Export transformed data
         if self.transformed_data is not None:
-            csv_path = output_path / 'transformed_data.csv'
-            self.transformed_data.to_csv(csv_path, index=False)
-            print(f"Exported CSV: {csv_path}")
-
-            excel_path = output_path / 'transformed_data.xlsx'
-            self.transformed_data.to_excel(excel_path, index=False)
-            print(f"Exported Excel: {excel_path}")
+            if 'csv' in formats:
+                csv_path = output_path / 'transformed_data.csv'
+                # pandas' writer even when pyarrow is installed: pyarrow's
+                # CSV differs (true/false booleans, quoted strings,
+                # nanosecond timestamps), and the file must not depend on
+                # which optional packages happen to be present
+                self.transformed_data.to_csv(csv_path, index=False)
+                print(f"Exported CSV: {csv_path}")
+
+            if 'parquet' in formats:
+                parquet_path = output_path / 'transformed_data.parquet'
+                self.transformed_data.to_parquet(parquet_path, index=False)
+                print(f"Exported Parquet: {parquet_path}")
+
+            if 'xlsx' in formats:
+                excel_path = output_path / 'transformed_data.xlsx'
+                self.transformed_data.to_excel(excel_path, index=False)
+                print(f"Exported Excel: {excel_path}")
 
         # Export analysis results
-        if self.results:
+        if self.results and 'json' in formats:
             json_path = output_path / 'analysis_results.json'
             with open(json_path, 'w') as f:
                 json.dump(self.results, f, indent=2, default=str)
@@ -327,7 +580,7 @@ def main():
     """
     Main function to run the pipeline demo.
     """
-    pipeline = DataPipeline()
+    pipeline = DataPipeline(verbose=True)
     results = pipeline.run_pipeline()
 
     print("\n--- Summary Statistics ---")
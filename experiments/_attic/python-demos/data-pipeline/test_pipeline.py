@@ -7,7 +7,7 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 import json
-from pipeline import DataPipeline
+from pipeline import DataPipeline, _clean_numeric, _reduceat_agg
 
 
 class TestDataPipeline:
@@ -18,6 +18,16 @@ class TestDataPipeline:
         """Create a pipeline instance for testing."""
         return DataPipeline()
 
+    @pytest.fixture(scope='module')
+    def analyzed_pipeline(self):
+        """Run the sample-data pipeline once for the read-only tests."""
+        pipeline = DataPipeline()
+        pipeline.load_data()
+        pipeline.clean_data()
+        pipeline.transform_data()
+        pipeline.analyze_data()
+        return pipeline
+
     @pytest.fixture
     def sample_data(self):
         """Generate sample data for testing."""
@@ -38,6 +48,17 @@ class TestDataPipeline:
         assert pipeline.transformed_data is None
         assert pipeline.results == {}
 
+    def test_import_leaves_pandas_options_alone(self, pipeline, sample_data):
+        """Test the pipeline does not switch on Copy-on-Write for the process."""
+        assert not pd.get_option('mode.copy_on_write')
+
+        pipeline.data = sample_data
+        original = sample_data.copy()
+        pipeline.clean_data()
+
+        # Cleaning works on its own frame, not on the loaded data
+        pd.testing.assert_frame_equal(pipeline.data, original)
+
     def test_generate_sample_data(self, pipeline):
         """Test sample data generation."""
         data = pipeline._generate_sample_data(n_records=100)
@@ -49,6 +70,18 @@ class TestDataPipeline:
         assert 'department' in data.columns
         assert data.isnull().sum().sum() > 0  # Should have some missing values
 
+    def test_clean_data_widens_float32_columns(self, pipeline):
+        """Test narrow sample dtypes do not leak into later stages."""
+        pipeline.data = pd.DataFrame({
+            'age': np.array([25, 30, 35, 40], dtype=np.int8),
+            'performance_score': np.array([4.5, 3.8, 4.2, 4.0], dtype=np.float32),
+        })
+
+        cleaned = pipeline.clean_data()
+
+        assert cleaned['performance_score'].dtype == np.float64
+        assert cleaned['age'].dtype == np.int8
+
     def test_load_data_generates_sample(self, pipeline):
         """Test that load_data generates sample data when no file provided."""
         data = pipeline.load_data()
@@ -57,6 +90,23 @@ class TestDataPipeline:
         assert len(data) > 0
         assert pipeline.data is not None
 
+    def test_parquet_metadata_cache_invalidated_on_rewrite(self, pipeline, tmp_path):
+        """Test a rewritten Parquet file is not read with its old footer."""
+        pytest.importorskip('pyarrow')
+        path = tmp_path / 'data.parquet'
+        pd.DataFrame({'id': [1, 2, 3], 'value': [1.0, 2.0, 3.0]}).to_parquet(path)
+
+        assert len(pipeline.load_data(str(path))) == 3
+        assert len(pipeline.load_data(str(path))) == 3
+        assert len(pipeline._parquet_metadata) == 1  # Footer parsed once
+
+        pd.DataFrame({'id': range(10), 'value': np.arange(10.0)}).to_parquet(path)
+        reloaded = pipeline.load_data(str(path))
+
+        assert len(reloaded) == 10
+        assert reloaded['id'].tolist() == list(range(10))
+        assert len(pipeline._parquet_metadata) == 2
+
     def test_clean_data_removes_duplicates(self, pipeline):
         """Test duplicate removal in cleaning."""
         # Create data with duplicates
@@ -100,13 +150,19 @@ class TestDataPipeline:
         assert (transformed['performance_percentage'] >= 0).all()
         assert (transformed['performance_percentage'] <= 100).all()
 
-    def test_analyze_data_returns_results(self, pipeline):
-        """Test data analysis returns proper structure."""
-        pipeline.load_data()
-        pipeline.clean_data()
-        pipeline.transform_data()
+    def test_years_with_company_precision(self, analyzed_pipeline):
+        """Test tenure is computed in float64 from the join date."""
+        df = analyzed_pipeline.transformed_data
+        years = df['years_with_company']
 
-        results = pipeline.analyze_data()
+        assert years.dtype == np.float64
+        expected = (pd.Timestamp.now() - df['join_date']).dt.days / 365.25
+        # Allow the day boundary to pass between transform and this check
+        assert (years - expected).abs().max() <= 1 / 365.25
+
+    def test_analyze_data_returns_results(self, analyzed_pipeline):
+        """Test data analysis returns proper structure."""
+        results = analyzed_pipeline.results
 
         # Check result structure
         assert 'summary_statistics' in results
@@ -120,13 +176,9 @@ class TestDataPipeline:
         assert 'average_salary' in results['summary_statistics']
         assert 'average_performance' in results['summary_statistics']
 
-    def test_analyze_data_calculates_statistics(self, pipeline):
+    def test_analyze_data_calculates_statistics(self, analyzed_pipeline):
         """Test that analysis calculates correct statistics."""
-        pipeline.load_data()
-        pipeline.clean_data()
-        pipeline.transform_data()
-
-        results = pipeline.analyze_data()
+        results = analyzed_pipeline.results
 
         stats = results['summary_statistics']
         assert stats['total_records'] > 0
@@ -134,19 +186,14 @@ class TestDataPipeline:
         assert stats['average_salary'] > 0
         assert 0 <= stats['average_performance'] <= 5
 
-    def test_export_data_creates_files(self, pipeline, tmp_path):
+    def test_export_data_creates_files(self, analyzed_pipeline, tmp_path):
         """Test data export creates expected files."""
-        pipeline.load_data()
-        pipeline.clean_data()
-        pipeline.transform_data()
-        pipeline.analyze_data()
-
         output_dir = tmp_path / "test_output"
-        pipeline.export_data(str(output_dir))
+        analyzed_pipeline.export_data(str(output_dir))
 
-        # Check files exist
+        # Check files exist; Excel is only written on request
         assert (output_dir / 'transformed_data.csv').exists()
-        assert (output_dir / 'transformed_data.xlsx').exists()
+        assert not (output_dir / 'transformed_data.xlsx').exists()
         assert (output_dir / 'analysis_results.json').exists()
 
         # Verify JSON content
@@ -154,6 +201,32 @@ class TestDataPipeline:
             json_data = json.load(f)
             assert 'summary_statistics' in json_data
 
+    def test_export_csv_round_trip(self, analyzed_pipeline, tmp_path):
+        """Test the exported CSV reads back with the original values."""
+        output_dir = tmp_path / "csv_output"
+        analyzed_pipeline.export_data(str(output_dir), formats=('csv',))
+
+        df = analyzed_pipeline.transformed_data
+        loaded = pd.read_csv(output_dir / 'transformed_data.csv', parse_dates=['join_date'])
+
+        assert loaded['join_date'].dtype == 'datetime64[ns]'
+        assert loaded['is_active'].dtype == bool
+        pd.testing.assert_series_equal(loaded['join_date'], df['join_date'])
+        pd.testing.assert_series_equal(loaded['is_active'], df['is_active'])
+        pd.testing.assert_series_equal(loaded['name'], df['name'])
+        pd.testing.assert_series_equal(loaded['salary'], df['salary'])
+
+    def test_export_data_excel_is_opt_in(self, analyzed_pipeline, tmp_path):
+        """Test Excel export is only written when requested."""
+        output_dir = tmp_path / "excel_output"
+        analyzed_pipeline.export_data(str(output_dir), formats=('xlsx',))
+
+        assert (output_dir / 'transformed_data.xlsx').exists()
+        assert not (output_dir / 'transformed_data.csv').exists()
+
+        with pytest.raises(ValueError, match="Unsupported export format"):
+            analyzed_pipeline.export_data(str(output_dir), formats=('xml',))
+
     def test_run_pipeline_executes_all_steps(self, pipeline):
         """Test that run_pipeline executes all steps."""
         results = pipeline.run_pipeline(export=False)
@@ -179,22 +252,16 @@ class TestDataPipeline:
         with pytest.raises(ValueError, match="No transformed data"):
             pipeline.analyze_data()
 
-    def test_department_analysis(self, pipeline):
+    def test_department_analysis(self, analyzed_pipeline):
         """Test department-level analysis."""
-        pipeline.load_data()
-        pipeline.clean_data()
-        pipeline.transform_data()
-        results = pipeline.analyze_data()
+        results = analyzed_pipeline.results
 
         dept_analysis = results['department_analysis']
         assert len(dept_analysis) > 0
 
-    def test_performance_analysis(self, pipeline):
+    def test_performance_analysis(self, analyzed_pipeline):
         """Test performance analysis."""
-        pipeline.load_data()
-        pipeline.clean_data()
-        pipeline.transform_data()
-        results = pipeline.analyze_data()
+        results = analyzed_pipeline.results
 
         perf = results['performance_analysis']
         assert 'high_performers_count' in perf
@@ -233,5 +300,107 @@ class TestDataPipeline:
         assert transformed['salary_band'].dtype.name == 'category'
 
 
+def _pandas_clean_numeric(df):
+    """Reference cleaning: pandas median fill, then IQR capping."""
+    filled = df.fillna(df.median())
+    with np.errstate(invalid='ignore'):
+        q1, q3 = filled.quantile(0.25), filled.quantile(0.75)
+    iqr = q3 - q1
+    lower_bound, upper_bound = q1 - 1.5 * iqr, q3 + 1.5 * iqr
+    outliers = ((filled < lower_bound) | (filled > upper_bound)).sum()
+    return filled.clip(lower_bound, upper_bound, axis=1), outliers.to_numpy()
+
+
+class TestCleanNumeric:
+    """Test _clean_numeric against the pandas-based cleaning."""
+
+    @pytest.mark.parametrize('column', [
+        [1.0, np.nan, 3.0, 100.0, 2.0, 2.5],
+        [1.0, np.inf, 2.0, 3.0, np.nan, 2.0],
+        [1.0, -np.inf, 2.0, 3.0, 4.0, 5.0],
+        [np.inf, np.inf, 1.0, 2.0, 3.0, 4.0],
+        [np.nan, np.nan, np.nan, np.nan, np.nan, np.nan],
+        [5.0, 5.0, 5.0, 5.0, 5.0, 5.0],
+    ])
+    def test_matches_pandas(self, column):
+        """Test NaN, inf and constant columns against pandas."""
+        df = pd.DataFrame({'value': column, 'other': [10.0, 11.0, 12.0, 13.0, np.nan, -50.0]})
+        expected, expected_outliers = _pandas_clean_numeric(df)
+
+        values = df.to_numpy(copy=True)
+        filled, outliers = _clean_numeric(values)
+
+        np.testing.assert_array_equal(values, expected.to_numpy())
+        assert outliers.tolist() == expected_outliers.tolist()
+        assert filled.tolist() == df.isna().sum().tolist()
+
+    def test_empty_input(self):
+        """Test a frame without rows."""
+        filled, outliers = _clean_numeric(np.empty((0, 2)))
+
+        assert filled.tolist() == [0, 0]
+        assert outliers.tolist() == [0, 0]
+
+    def test_non_numeric_columns_bypass_kernel(self):
+        """Test clean_data only sends numeric columns through the kernel."""
+        pipeline = DataPipeline()
+        pipeline.data = pd.DataFrame({
+            'value': [1.0, np.nan, 3.0, 100.0, 2.0, 2.5],
+            'label': ['1', '2', None, '2', 'x', '2'],
+        })
+
+        cleaned = pipeline.clean_data()
+        expected, _ = _pandas_clean_numeric(pipeline.data[['value']])
+
+        pd.testing.assert_series_equal(cleaned['value'], expected['value'])
+        assert cleaned['label'].tolist() == ['1', '2', '2', '2', 'x', '2']
+
+
+class TestReduceatAgg:
+    """Test _reduceat_agg against pandas groupby().agg()."""
+
+    @pytest.fixture
+    def grouped_frame(self):
+        """Categorical groups with NaNs, a missing key and an empty category."""
+        return pd.DataFrame({
+            'group': pd.Categorical(['b', 'a', 'b', None, 'a', 'b', 'd'],
+                                    categories=['a', 'b', 'c', 'd']),
+            'x': [1.0, np.nan, 3.0, 4.0, 5.0, np.nan, np.nan],
+            'y': [10.0, 20.0, 30.0, 40.0, 50.0, 60.0, 70.0],
+        })
+
+    def test_matches_groupby_agg(self, grouped_frame):
+        """Test every reduction, including empty and all-NaN groups."""
+        df = grouped_frame
+        funcs = {f'{column}_{func}': (column, func)
+                 for column in ('x', 'y')
+                 for func in ('count', 'mean', 'median', 'min', 'max')}
+        values = {column: df[column].to_numpy() for column in ('x', 'y')}
+        codes = df['group'].cat.codes.to_numpy()
+
+        result = _reduceat_agg(codes, values, funcs, len(df['group'].cat.categories))
+
+        expected = df.groupby('group', observed=False).agg(
+            {column: ['count', 'mean', 'median', 'min', 'max'] for column in ('x', 'y')})
+        for (column, func), series in expected.items():
+            np.testing.assert_allclose(result[f'{column}_{func}'],
+                                       series.to_numpy(dtype=np.float64))
+
+    def test_empty_groups_get_zero_count_and_nan(self):
+        """Test groups without rows, as groupby(observed=False) reports them."""
+        codes = np.array([-1, -1])
+        values = {'x': np.array([1.0, 2.0])}
+
+        result = _reduceat_agg(codes, values, {'n': ('x', 'count'), 'm': ('x', 'mean')}, 2)
+
+        assert result['n'].tolist() == [0, 0]
+        assert np.isnan(result['m']).all()
+
+    def test_unsupported_aggregation(self):
+        """Test unknown reductions are rejected."""
+        with pytest.raises(ValueError, match="Unsupported aggregation"):
+            _reduceat_agg(np.array([0]), {'x': np.array([1.0])}, {'s': ('x', 'std')})
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])